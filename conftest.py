@@ -0,0 +1,84 @@
+"""
+Shared pytest fixtures for the Wine Tasting Visual Vocabulary test suite.
+
+Expensive tool outputs are computed once per test session and reused;
+tests must treat the returned dicts as read-only.
+"""
+
+import pytest
+import server
+
+
+def _params_key(params):
+    """Hashable key for tool keyword arguments; list values such as primary_aromas become tuples"""
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in params.items()
+    ))
+
+
+@pytest.fixture(scope="session")
+def wine_vocab_factory():
+    """Return a memoized generate_wine_visual_vocabulary keyed by its parameters"""
+    cache = {}
+
+    def make(**kwargs):
+        key = _params_key(kwargs)
+        if key not in cache:
+            cache[key] = server.generate_wine_visual_vocabulary.fn(**kwargs)
+        return cache[key]
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def compare_cached():
+    """Return a memoized compare_wine_profiles keyed by both wines' parameters"""
+    cache = {}
+
+    def compare(wine1_params, wine2_params):
+        key = (_params_key(wine1_params), _params_key(wine2_params))
+        if key not in cache:
+            cache[key] = server.compare_wine_profiles.fn(
+                wine1_params=wine1_params,
+                wine2_params=wine2_params
+            )
+        return cache[key]
+
+    return compare
+
+
+@pytest.fixture(scope="session")
+def preset_cache():
+    """Every regional preset's vocabulary, keyed by region name"""
+    # An unknown region lists every supported one in the tool's error response
+    regions = server.create_regional_preset.fn("")["available_regions"]
+    return {region: server.create_regional_preset.fn(region) for region in regions}
+
+
+@pytest.fixture(scope="session")
+def pinot_cool_evolution():
+    """Four-age evolution sequence for a cool-climate Pinot Noir"""
+    return server.evolution_sequence.fn(varietal="pinot_noir", climate="cool")
+
+
+@pytest.fixture(scope="session")
+def cab_moderate_evolution():
+    """Four-age evolution sequence for a tannic moderate-climate Cabernet"""
+    return server.evolution_sequence.fn(
+        varietal="cabernet_sauvignon",
+        climate="moderate",
+        tannin=8.0
+    )
+
+
+@pytest.fixture(scope="session")
+def clusters():
+    """The aroma cluster listing returned by get_aroma_clusters"""
+    return server.get_aroma_clusters.fn()
+
+
+@pytest.fixture(scope="session")
+def varietals():
+    """The varietal listing returned by get_varietal_list"""
+    return server.get_varietal_list.fn()
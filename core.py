@@ -0,0 +1,2919 @@
+"""
+Wine Tasting Visual Vocabulary - Core Implementation
+
+Plain-Python implementation of every tool; server.py registers these
+functions with FastMCP, and in-process callers can use them directly.
+
+Translates oenological expertise into visual parameters for image generation.
+Based on systematic wine evaluation methodology from Court of Master Sommeliers
+and WSET (Wine & Spirit Education Trust) frameworks.
+
+Categorical Structure:
+- Varietal Character (base functor)
+- Terroir/Region (environmental modifier)
+- Winemaking Technique (process overlay)
+- Temporal Evolution (aging dimension)
+- Balance Relationships (coherence constraints)
+"""
+
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from itertools import product
+from operator import index, itemgetter
+from types import MappingProxyType
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+import numpy as np
+import yaml
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numeric kernels fall back to numpy
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _freeze(obj):
+    """Recursively intern string leaves, turn lists into tuples and wrap dicts in read-only proxies."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, frozenset):
+        return frozenset(_freeze(v) for v in obj)
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+def _hex_to_rgb(hex_color: str) -> tuple:
+    """Parse a '#RRGGBB' string into an (r, g, b) tuple of 0-255 ints."""
+    return tuple(int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+# Set WINE_MCP_COMPACT=1 (or true/yes/on) to serialize every response without indentation
+_COMPACT_JSON = os.environ.get("WINE_MCP_COMPACT", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _dumps(obj, indent: bool = False) -> str:
+    """Serialize a tool response to JSON text, with orjson when it is installed.
+    
+    The stdlib fallback uses orjson's separators and leaves non-ASCII text
+    unescaped, so responses are byte-identical either way.
+    """
+    indent = indent and not _COMPACT_JSON
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=dict, option=option).decode()
+    if indent:
+        return json.dumps(obj, default=dict, indent=2, ensure_ascii=False)
+    return json.dumps(obj, default=dict, separators=(",", ":"), ensure_ascii=False)
+
+
+# ============================================================================
+# TYPE DEFINITIONS - Categorical Objects
+# ============================================================================
+# The categorical enums mix in str, so members hash and compare equal to
+# their raw values and the string-keyed tables below accept either form.
+
+class WineType(Enum):
+    RED = "red"
+    WHITE = "white"
+    ROSE = "rosé"
+    SPARKLING = "sparkling"
+    DESSERT = "dessert"
+    FORTIFIED = "fortified"
+
+class Varietal(str, Enum):
+    # Red Varietals
+    PINOT_NOIR = "pinot_noir"
+    CABERNET_SAUVIGNON = "cabernet_sauvignon"
+    MERLOT = "merlot"
+    SYRAH = "syrah"
+    GRENACHE = "grenache"
+    NEBBIOLO = "nebbiolo"
+    SANGIOVESE = "sangiovese"
+    TEMPRANILLO = "tempranillo"
+    MALBEC = "malbec"
+    ZINFANDEL = "zinfandel"
+    
+    # White Varietals
+    CHARDONNAY = "chardonnay"
+    SAUVIGNON_BLANC = "sauvignon_blanc"
+    RIESLING = "riesling"
+    PINOT_GRIGIO = "pinot_grigio"
+    CHENIN_BLANC = "chenin_blanc"
+    GEWURZTRAMINER = "gewurztraminer"
+    VIOGNIER = "viognier"
+    ALBARINO = "albariño"
+
+class ClimateType(str, Enum):
+    COOL = "cool"
+    MODERATE = "moderate"
+    WARM = "warm"
+    HOT = "hot"
+
+class WinemakingStyle(str, Enum):
+    OLD_WORLD = "old_world"
+    NEW_WORLD = "new_world"
+
+class OakTreatment(str, Enum):
+    NONE = "none"
+    NEUTRAL = "neutral"
+    FRENCH_OAK = "french_oak"
+    AMERICAN_OAK = "american_oak"
+    MIXED_OAK = "mixed_oak"
+
+class AgeCategory(str, Enum):
+    YOUTHFUL = "youthful"
+    DEVELOPING = "developing"
+    MATURE = "mature"
+    PAST_PRIME = "past_prime"
+
+class FinishLength(str, Enum):
+    SHORT = "short"
+    MEDIUM = "medium"
+    LONG = "long"
+    VERY_LONG = "very_long"
+
+# ============================================================================
+# VARIETAL CHARACTER - Base Functor
+# ============================================================================
+
+VARIETAL_CHARACTERISTICS = {
+    # Red Varietals
+    Varietal.PINOT_NOIR: {
+        "color_base": "ruby translucent",
+        "color_hue": "#8B2635",
+        "opacity": 0.6,
+        "texture": "delicate silky",
+        "structure": "fine-grained elegant",
+        "visual_weight": "light ethereal",
+        "characteristic_notes": ["cherry", "mushroom", "forest_floor", "rose_petal"],
+        "edge_quality": "soft diffused",
+        "composition": "nuanced layered intimate"
+    },
+    Varietal.CABERNET_SAUVIGNON: {
+        "color_base": "deep purple opaque",
+        "color_hue": "#2C1810",
+        "opacity": 0.95,
+        "texture": "structured firm",
+        "structure": "bold geometric angular",
+        "visual_weight": "full commanding",
+        "characteristic_notes": ["blackcurrant", "cedar", "graphite", "tobacco"],
+        "edge_quality": "defined precise",
+        "composition": "architectural powerful monumental"
+    },
+    Varietal.MERLOT: {
+        "color_base": "ruby garnet",
+        "color_hue": "#722F37",
+        "opacity": 0.8,
+        "texture": "plush velvety",
+        "structure": "rounded soft",
+        "visual_weight": "medium approachable",
+        "characteristic_notes": ["plum", "chocolate", "vanilla", "leather"],
+        "edge_quality": "gentle flowing",
+        "composition": "harmonious welcoming generous"
+    },
+    Varietal.SYRAH: {
+        "color_base": "inky purple black",
+        "color_hue": "#1A0F14",
+        "opacity": 0.9,
+        "texture": "dense smoky",
+        "structure": "wild untamed powerful",
+        "visual_weight": "full intense",
+        "characteristic_notes": ["blackberry", "smoke", "pepper", "bacon_fat"],
+        "edge_quality": "dramatic bold",
+        "composition": "primal visceral dynamic"
+    },
+    Varietal.NEBBIOLO: {
+        "color_base": "garnet brick translucent",
+        "color_hue": "#9B4F47",
+        "opacity": 0.65,
+        "texture": "grippy chalky tannic",
+        "structure": "austere angular aristocratic",
+        "visual_weight": "medium ethereal",
+        "characteristic_notes": ["rose", "tar", "truffle", "dried_cherry"],
+        "edge_quality": "sharp precise",
+        "composition": "noble stern elegant"
+    },
+    Varietal.GRENACHE: {
+        "color_base": "ruby translucent warm",
+        "color_hue": "#A52A2A",
+        "opacity": 0.7,
+        "texture": "soft approachable",
+        "structure": "rounded generous friendly",
+        "visual_weight": "medium light",
+        "characteristic_notes": ["strawberry", "raspberry", "white_pepper", "herbs"],
+        "edge_quality": "soft flowing",
+        "composition": "warm welcoming open"
+    },
+    Varietal.SANGIOVESE: {
+        "color_base": "ruby bright",
+        "color_hue": "#8B0000",
+        "opacity": 0.75,
+        "texture": "firm savory",
+        "structure": "angular structured linear",
+        "visual_weight": "medium bright",
+        "characteristic_notes": ["cherry", "tomato", "herbs", "earth"],
+        "edge_quality": "defined crisp",
+        "composition": "savory focused precise"
+    },
+    Varietal.TEMPRANILLO: {
+        "color_base": "ruby garnet",
+        "color_hue": "#8B2635",
+        "opacity": 0.8,
+        "texture": "medium-bodied balanced",
+        "structure": "moderate structured",
+        "visual_weight": "medium substantial",
+        "characteristic_notes": ["cherry", "leather", "tobacco", "vanilla"],
+        "edge_quality": "smooth defined",
+        "composition": "balanced traditional composed"
+    },
+    Varietal.MALBEC: {
+        "color_base": "deep purple inky",
+        "color_hue": "#2C0E3F",
+        "opacity": 0.9,
+        "texture": "plush dense",
+        "structure": "full-bodied powerful",
+        "visual_weight": "full dense",
+        "characteristic_notes": ["blackberry", "plum", "chocolate", "violet"],
+        "edge_quality": "soft deep",
+        "composition": "lush opulent powerful"
+    },
+    Varietal.ZINFANDEL: {
+        "color_base": "deep ruby purple",
+        "color_hue": "#722F37",
+        "opacity": 0.85,
+        "texture": "bold jammy",
+        "structure": "powerful intense",
+        "visual_weight": "full heavy",
+        "characteristic_notes": ["blackberry", "jam", "spice", "tobacco"],
+        "edge_quality": "bold dramatic",
+        "composition": "intense powerful exuberant"
+    },
+    
+    # White Varietals
+    Varietal.CHARDONNAY: {
+        "color_base": "golden straw",
+        "color_hue": "#F4E4C1",
+        "opacity": 0.85,
+        "texture": "creamy rich",
+        "structure": "full-bodied opulent",
+        "visual_weight": "medium to full",
+        "characteristic_notes": ["apple", "butter", "vanilla", "hazelnut"],
+        "edge_quality": "smooth rounded",
+        "composition": "luxurious generous expansive"
+    },
+    Varietal.SAUVIGNON_BLANC: {
+        "color_base": "pale straw green-tinged",
+        "color_hue": "#F5F5DC",
+        "opacity": 0.9,
+        "texture": "crisp electric",
+        "structure": "lean racy angular",
+        "visual_weight": "light precise",
+        "characteristic_notes": ["grapefruit", "grass", "gooseberry", "flint"],
+        "edge_quality": "sharp cutting",
+        "composition": "vibrant energetic focused"
+    },
+    Varietal.RIESLING: {
+        "color_base": "pale yellow crystalline",
+        "color_hue": "#FFFACD",
+        "opacity": 0.95,
+        "texture": "crystalline pure",
+        "structure": "taut precise delicate",
+        "visual_weight": "light to medium",
+        "characteristic_notes": ["lime", "petrol", "honey", "slate"],
+        "edge_quality": "razor-sharp brilliant",
+        "composition": "luminous transparent exact"
+    },
+    Varietal.VIOGNIER: {
+        "color_base": "deep golden",
+        "color_hue": "#FFD700",
+        "opacity": 0.8,
+        "texture": "viscous oily",
+        "structure": "full perfumed exotic",
+        "visual_weight": "full voluptuous",
+        "characteristic_notes": ["apricot", "honeysuckle", "peach", "ginger"],
+        "edge_quality": "soft blurred aromatic",
+        "composition": "sensuous heady intoxicating"
+    },
+    Varietal.PINOT_GRIGIO: {
+        "color_base": "pale straw light",
+        "color_hue": "#F5F5DC",
+        "opacity": 0.9,
+        "texture": "light crisp",
+        "structure": "simple clean refreshing",
+        "visual_weight": "light delicate",
+        "characteristic_notes": ["lemon", "apple", "pear", "almond"],
+        "edge_quality": "clean sharp",
+        "composition": "simple direct refreshing"
+    },
+    Varietal.CHENIN_BLANC: {
+        "color_base": "golden straw",
+        "color_hue": "#F4E4C1",
+        "opacity": 0.85,
+        "texture": "waxy honeyed",
+        "structure": "versatile complex",
+        "visual_weight": "medium rich",
+        "characteristic_notes": ["honey", "quince", "chamomile", "ginger"],
+        "edge_quality": "smooth textured",
+        "composition": "complex textural layered"
+    },
+    Varietal.GEWURZTRAMINER: {
+        "color_base": "deep golden",
+        "color_hue": "#FFD700",
+        "opacity": 0.82,
+        "texture": "oily perfumed",
+        "structure": "exotic aromatic spicy",
+        "visual_weight": "medium full",
+        "characteristic_notes": ["lychee", "rose", "ginger", "spice"],
+        "edge_quality": "aromatic diffused",
+        "composition": "exotic perfumed intense"
+    },
+    Varietal.ALBARINO: {
+        "color_base": "pale yellow green-tinged",
+        "color_hue": "#FFFACD",
+        "opacity": 0.9,
+        "texture": "fresh saline",
+        "structure": "crisp coastal bright",
+        "visual_weight": "light medium",
+        "characteristic_notes": ["citrus", "peach", "saline", "minerals"],
+        "edge_quality": "bright clean",
+        "composition": "fresh coastal vibrant"
+    }
+}
+# Each hue as an (r, g, b) tuple for callers that need numeric channels
+for _char in VARIETAL_CHARACTERISTICS.values():
+    _char["color_hue_rgb"] = _hex_to_rgb(_char["color_hue"])
+VARIETAL_CHARACTERISTICS = _freeze({k.value: v for k, v in VARIETAL_CHARACTERISTICS.items()})
+
+# ============================================================================
+# TERROIR & CLIMATE - Environmental Modifiers
+# ============================================================================
+
+CLIMATE_MODIFIERS = {
+    ClimateType.COOL: {
+        "color_shift": "lighter brighter",
+        "saturation_adjust": -0.15,
+        "brightness_adjust": 0.1,
+        "texture_modifier": "crisp angular tense",
+        "atmosphere": "cool restrained mineral",
+        "visual_tension": "high precise",
+        "edge_treatment": "sharp defined"
+    },
+    ClimateType.MODERATE: {
+        "color_shift": "balanced",
+        "saturation_adjust": 0.0,
+        "brightness_adjust": 0.0,
+        "texture_modifier": "harmonious integrated",
+        "atmosphere": "temperate balanced elegant",
+        "visual_tension": "medium composed",
+        "edge_treatment": "clean refined"
+    },
+    ClimateType.WARM: {
+        "color_shift": "deeper richer",
+        "saturation_adjust": 0.1,
+        "brightness_adjust": -0.05,
+        "texture_modifier": "soft ripe generous",
+        "atmosphere": "warm sun-drenched opulent",
+        "visual_tension": "low relaxed",
+        "edge_treatment": "soft blended"
+    },
+    ClimateType.HOT: {
+        "color_shift": "intense dark",
+        "saturation_adjust": 0.2,
+        "brightness_adjust": -0.15,
+        "texture_modifier": "jammy concentrated thick",
+        "atmosphere": "hot intense powerful",
+        "visual_tension": "very low heavy",
+        "edge_treatment": "blurred diffused"
+    }
+}
+CLIMATE_MODIFIERS = _freeze({k.value: v for k, v in CLIMATE_MODIFIERS.items()})
+
+WINEMAKING_STYLE_MODIFIERS = {
+    WinemakingStyle.OLD_WORLD: {
+        "aesthetic": "restrained mineral earthy",
+        "composition": "subtle understated elegant",
+        "color_treatment": "muted sophisticated tertiary",
+        "detail_level": "fine precise intricate",
+        "atmosphere": "cool stone cellar ancient"
+    },
+    WinemakingStyle.NEW_WORLD: {
+        "aesthetic": "fruit-forward bold exuberant",
+        "composition": "generous obvious accessible",
+        "color_treatment": "vibrant primary saturated",
+        "detail_level": "bold clear direct",
+        "atmosphere": "sunny modern open"
+    }
+}
+WINEMAKING_STYLE_MODIFIERS = _freeze({k.value: v for k, v in WINEMAKING_STYLE_MODIFIERS.items()})
+
+# ============================================================================
+# OAK TREATMENT - Process Overlay
+# ============================================================================
+
+OAK_CHARACTERISTICS = {
+    OakTreatment.NONE: {
+        "texture_overlay": "pure clean unadulterated",
+        "color_influence": "none",
+        "finish_quality": "bright transparent",
+        "material_reference": "glass crystal water"
+    },
+    OakTreatment.NEUTRAL: {
+        "texture_overlay": "subtle softened rounded",
+        "color_influence": "minimal slight warmth",
+        "finish_quality": "smooth integrated",
+        "material_reference": "aged_wood smooth_stone"
+    },
+    OakTreatment.FRENCH_OAK: {
+        "texture_overlay": "silky refined spice",
+        "color_influence": "golden vanilla subtle toast",
+        "finish_quality": "elegant sophisticated polished",
+        "material_reference": "fine_wood polished_bronze"
+    },
+    OakTreatment.AMERICAN_OAK: {
+        "texture_overlay": "bold creamy coconut",
+        "color_influence": "deep amber vanilla caramel",
+        "finish_quality": "rich obvious sweet",
+        "material_reference": "charred_wood bourbon_barrel"
+    },
+    OakTreatment.MIXED_OAK: {
+        "texture_overlay": "complex layered spice-sweet",
+        "color_influence": "warm amber golden vanilla",
+        "finish_quality": "balanced nuanced",
+        "material_reference": "varied_wood aged_patina"
+    }
+}
+OAK_CHARACTERISTICS = _freeze({k.value: v for k, v in OAK_CHARACTERISTICS.items()})
+
+# ============================================================================
+# TEMPORAL EVOLUTION - Aging Dimension
+# ============================================================================
+
+AGE_TRANSFORMATIONS = {
+    AgeCategory.YOUTHFUL: {
+        "color_evolution": "vibrant primary bright",
+        "red_color_shift": "purple ruby",
+        "white_color_shift": "pale straw green-tinged",
+        "aromatic_category": "primary fruit-forward fresh",
+        "texture_state": "taut structured firm",
+        "integration": "separate distinct angular",
+        "visual_clarity": "brilliant star-bright",
+        "time_signature": "present immediate vivid"
+    },
+    AgeCategory.DEVELOPING: {
+        "color_evolution": "deepening softening",
+        "red_color_shift": "garnet ruby-brick",
+        "white_color_shift": "golden straw",
+        "aromatic_category": "secondary developing complex",
+        "texture_state": "integrating softening",
+        "integration": "blending harmonizing",
+        "visual_clarity": "bright clear",
+        "time_signature": "transitional evolving"
+    },
+    AgeCategory.MATURE: {
+        "color_evolution": "tertiary evolved",
+        "red_color_shift": "brick garnet tawny-edge",
+        "white_color_shift": "deep-gold amber",
+        "aromatic_category": "tertiary developed savory",
+        "texture_state": "silky resolved integrated",
+        "integration": "seamless unified complete",
+        "visual_clarity": "clear luminous",
+        "time_signature": "patient wise settled"
+    },
+    AgeCategory.PAST_PRIME: {
+        "color_evolution": "fading oxidized",
+        "red_color_shift": "brown tawny brick-brown",
+        "white_color_shift": "deep-amber brown-tinged",
+        "aromatic_category": "fading oxidized tired",
+        "texture_state": "thin drying out",
+        "integration": "falling apart disjointed",
+        "visual_clarity": "dull fading",
+        "time_signature": "past declining fragile"
+    }
+}
+AGE_TRANSFORMATIONS = _freeze({k.value: v for k, v in AGE_TRANSFORMATIONS.items()})
+
+# ============================================================================
+# AROMA/FLAVOR CLUSTERS - Palette Generators
+# ============================================================================
+
+# Kept as a plain dict: get_aroma_clusters returns it as-is, and the MCP
+# serializer cannot encode MappingProxyType
+AROMA_CLUSTERS = {
+    "red_fruit": {
+        "notes": ["cherry", "raspberry", "strawberry", "cranberry", "red_currant"],
+        "color_palette": ["#DC143C", "#C71585", "#FF6B6B", "#E74C3C"],
+        "brightness": "bright vivid fresh",
+        "texture": "juicy tart crisp"
+    },
+    "black_fruit": {
+        "notes": ["blackberry", "blackcurrant", "black_cherry", "plum", "blueberry"],
+        "color_palette": ["#1A0F14", "#2C1810", "#4A0E4E", "#191970"],
+        "brightness": "deep dark concentrated",
+        "texture": "dense rich powerful"
+    },
+    "stone_fruit": {
+        "notes": ["peach", "apricot", "nectarine", "plum"],
+        "color_palette": ["#FFDAB9", "#FFB347", "#FF8C69", "#DDA0DD"],
+        "brightness": "warm glowing ripe",
+        "texture": "soft luscious velvety"
+    },
+    "citrus": {
+        "notes": ["lemon", "lime", "grapefruit", "orange_zest"],
+        "color_palette": ["#FFF44F", "#BFFF00", "#FF6F61", "#FFD700"],
+        "brightness": "electric vibrant zesty",
+        "texture": "sharp crisp cutting"
+    },
+    "tropical": {
+        "notes": ["pineapple", "mango", "passion_fruit", "lychee", "guava"],
+        "color_palette": ["#FFD700", "#FF8C00", "#FF69B4", "#F0E68C"],
+        "brightness": "exotic bright heady",
+        "texture": "lush voluptuous perfumed"
+    },
+    "earth_mineral": {
+        "notes": ["wet_stone", "slate", "chalk", "graphite", "flint", "petrichor"],
+        "color_palette": ["#708090", "#696969", "#A9A9A9", "#2F4F4F"],
+        "brightness": "cool muted subtle",
+        "texture": "dry stony mineral"
+    },
+    "forest_floor": {
+        "notes": ["mushroom", "truffle", "forest_floor", "damp_leaves", "soil"],
+        "color_palette": ["#3E2723", "#5D4037", "#4E342E", "#654321"],
+        "brightness": "dark earthy organic",
+        "texture": "loamy dense humid"
+    },
+    "oak_spice": {
+        "notes": ["vanilla", "cinnamon", "clove", "nutmeg", "cedar", "toast"],
+        "color_palette": ["#D2691E", "#CD853F", "#DEB887", "#8B4513"],
+        "brightness": "warm amber golden",
+        "texture": "smooth spicy aromatic"
+    },
+    "leather_tobacco": {
+        "notes": ["leather", "tobacco", "cigar_box", "dried_herbs"],
+        "color_palette": ["#8B4513", "#654321", "#704214", "#3E2723"],
+        "brightness": "aged patinated rich",
+        "texture": "supple smooth aged"
+    },
+    "floral": {
+        "notes": ["rose", "violet", "honeysuckle", "jasmine", "orange_blossom"],
+        "color_palette": ["#FFB6C1", "#DDA0DD", "#E6E6FA", "#FFF0F5"],
+        "brightness": "delicate perfumed aromatic",
+        "texture": "soft ethereal fragrant"
+    }
+}
+
+# Intern the descriptor strings and store note/palette lists as tuples; the
+# dict itself stays mutable because it is returned to MCP clients as-is
+for _cluster in AROMA_CLUSTERS.values():
+    _cluster["brightness"] = sys.intern(_cluster["brightness"])
+    _cluster["texture"] = sys.intern(_cluster["texture"])
+    _cluster["notes"] = tuple(sys.intern(note) for note in _cluster["notes"])
+    _cluster["color_palette"] = tuple(sys.intern(color) for color in _cluster["color_palette"])
+
+# Reverse index: note -> names of every cluster listing it, in AROMA_CLUSTERS
+# order (a note such as "plum" can belong to more than one cluster)
+NOTE_TO_CLUSTERS = {}
+for _cluster_name, _cluster in AROMA_CLUSTERS.items():
+    for _note in _cluster["notes"]:
+        NOTE_TO_CLUSTERS.setdefault(_note, []).append(_cluster_name)
+NOTE_TO_CLUSTERS = _freeze(NOTE_TO_CLUSTERS)
+
+# Same index resolved to the cluster dicts, for the aroma overlay
+_NOTE_TO_CLUSTERS = {
+    note: tuple(AROMA_CLUSTERS[name] for name in names)
+    for note, names in NOTE_TO_CLUSTERS.items()
+}
+
+# ============================================================================
+# BALANCE DIMENSIONS - Coherence Constraints
+# ============================================================================
+
+def _balance_scores(acidity, tannin, body, alcohol):
+    """Return (tension_score, weight_score) on a 0-1 scale."""
+    acid_tension = acidity / 10.0
+    tannin_tension = tannin / 10.0
+    
+    # Tension is driven by structural elements (acid + tannin)
+    tension_score = (acid_tension + tannin_tension) / 2
+    
+    # Weight is driven by body and alcohol
+    weight_score = (body + alcohol) / 20.0
+    
+    return tension_score, weight_score
+
+
+# Descriptor tables indexed by how many thresholds the score clears
+_TENSION_LABELS = ("low soft relaxed", "medium balanced", "high angular taut")
+_WEIGHT_LABELS = ("light ethereal transparent", "medium substantial", "full dense heavy opaque")
+
+
+def _tension_descriptor(tension_score: float) -> str:
+    """Map a tension score to its visual descriptor"""
+    return _TENSION_LABELS[(tension_score > 0.45) + (tension_score > 0.65)]
+
+
+def _weight_descriptor(weight_score: float) -> str:
+    """Map a weight score to its visual descriptor"""
+    return _WEIGHT_LABELS[(weight_score > 0.4) + (weight_score > 0.7)]
+
+
+@dataclass(slots=True, frozen=True)
+class BalanceProfile:
+    """Represents the equilibrium relationships in wine"""
+    acidity: float  # 1-10 scale
+    tannin: float  # 1-10 scale (reds only)
+    sweetness: float  # 1-10 scale
+    alcohol: float  # 1-10 scale
+    body: float  # 1-10 scale
+    _tension: str = field(init=False, repr=False, compare=False)
+    _weight: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # One kernel call scores both; frozen, so the descriptors can never go stale
+        tension_score, weight_score = _balance_scores(self.acidity, self.tannin, self.body, self.alcohol)
+        object.__setattr__(self, "_tension", _tension_descriptor(tension_score))
+        object.__setattr__(self, "_weight", _weight_descriptor(weight_score))
+    
+    def get_visual_tension(self) -> str:
+        """Calculate overall visual tension from balance"""
+        return self._tension
+    
+    def get_visual_weight(self) -> str:
+        """Calculate visual density from body and alcohol"""
+        return self._weight
+
+# ============================================================================
+# FINISH DIMENSION - Temporal Decay
+# ============================================================================
+
+FINISH_CHARACTERISTICS = {
+    FinishLength.SHORT: {
+        "length_descriptor": "brief fleeting",
+        "edge_treatment": "abrupt clean",
+        "fade_pattern": "rapid quick dissipating",
+        "atmospheric_depth": "shallow immediate"
+    },
+    FinishLength.MEDIUM: {
+        "length_descriptor": "moderate sustained",
+        "edge_treatment": "gradual smooth",
+        "fade_pattern": "steady even balanced",
+        "atmospheric_depth": "middle-ground present"
+    },
+    FinishLength.LONG: {
+        "length_descriptor": "persistent lingering",
+        "edge_treatment": "extended soft",
+        "fade_pattern": "slow gradual evolving",
+        "atmospheric_depth": "deep receding distant"
+    },
+    FinishLength.VERY_LONG: {
+        "length_descriptor": "endless immortal",
+        "edge_treatment": "infinite dissolving",
+        "fade_pattern": "complex ever-changing eternal",
+        "atmospheric_depth": "vast infinite horizon"
+    }
+}
+FINISH_CHARACTERISTICS = _freeze({k.value: v for k, v in FINISH_CHARACTERISTICS.items()})
+
+# ============================================================================
+# MCP TOOLS - Morphisms
+# ============================================================================
+
+# Helper function to determine if varietal is red or white
+RED_VARIETALS = frozenset({
+    Varietal.PINOT_NOIR, Varietal.CABERNET_SAUVIGNON, Varietal.MERLOT, Varietal.SYRAH,
+    Varietal.NEBBIOLO, Varietal.GRENACHE, Varietal.SANGIOVESE, Varietal.TEMPRANILLO,
+    Varietal.MALBEC, Varietal.ZINFANDEL
+})
+
+
+def is_red_varietal(varietal_name: str) -> bool:
+    """Determine if a varietal is red or white based on name (or Varietal member)"""
+    if isinstance(varietal_name, Varietal):
+        return varietal_name in RED_VARIETALS
+    # Varietal is a str enum, so raw names hash and compare equal to the members
+    return varietal_name.lower() in RED_VARIETALS
+
+
+# ============================================================================
+# TAXONOMY CACHING - Load once at module initialization
+# ============================================================================
+_TAXONOMY_CACHE = None
+
+def _load_taxonomy() -> Dict[str, Any]:
+    """Load taxonomy ONCE and cache it at module level."""
+    global _TAXONOMY_CACHE
+    if _TAXONOMY_CACHE is None:
+        yaml_path = Path(__file__).parent / "wine_tasting_olog.yaml"
+        with open(yaml_path, 'r') as f:
+            _TAXONOMY_CACHE = yaml.load(f, Loader=_YAML_LOADER)
+    return _TAXONOMY_CACHE
+
+# Pre-load taxonomy on module import
+TAXONOMY = _load_taxonomy()
+
+
+# ============================================================================
+# CATEGORICAL PRECOMPUTATION - Every enum combination built once at import
+# ============================================================================
+
+# Struct-of-arrays view of VARIETAL_CHARACTERISTICS: field -> {varietal value: entry},
+# with each field's fallback applied once here instead of at every lookup
+_VARIETAL_FIELD_DEFAULTS = {
+    "color_hue": "#FFFFFF",
+    "color_base": "",
+    "opacity": 0.8,
+    "texture": "",
+    "structure": "",
+    "composition": "",
+    "edge_quality": "",
+    "characteristic_notes": ()
+}
+_VARIETAL_COLUMNS = _freeze({
+    name: {varietal: char.get(name, default) for varietal, char in VARIETAL_CHARACTERISTICS.items()}
+    for name, default in _VARIETAL_FIELD_DEFAULTS.items()
+})
+
+_AGE_PATINA = {
+    AgeCategory.YOUTHFUL: "fresh new",
+    AgeCategory.DEVELOPING: "fresh new",
+    AgeCategory.MATURE: "aged weathered",
+    AgeCategory.PAST_PRIME: "aged weathered"
+}
+
+
+def _build_categorical(
+    varietal_enum: Varietal,
+    climate_enum: ClimateType,
+    style_enum: WinemakingStyle,
+    oak_enum: OakTreatment,
+    age_enum: AgeCategory
+) -> MappingProxyType:
+    """
+    Assemble the vocabulary sections that depend only on categorical inputs.
+    
+    Fields driven by the balance, finish or aroma inputs are left as None
+    placeholders so the tool can overlay them without reordering keys.
+    """
+    climate_mod = CLIMATE_MODIFIERS[climate_enum]
+    style_mod = WINEMAKING_STYLE_MODIFIERS[style_enum]
+    oak_char = OAK_CHARACTERISTICS[oak_enum]
+    age_transform = AGE_TRANSFORMATIONS[age_enum]
+    
+    return _freeze({
+        "base_color": {
+            "hue": _VARIETAL_COLUMNS["color_hue"][varietal_enum],
+            "description": _VARIETAL_COLUMNS["color_base"][varietal_enum],
+            "age_modified": age_transform.get("red_color_shift" if varietal_enum in RED_VARIETALS else "white_color_shift", ""),
+            "climate_shift": climate_mod["color_shift"]
+        },
+        
+        "opacity_clarity": {
+            "base_opacity": _VARIETAL_COLUMNS["opacity"][varietal_enum],
+            "clarity": age_transform["visual_clarity"],
+            "visual_weight": None
+        },
+        
+        "texture_surface": {
+            "base_texture": _VARIETAL_COLUMNS["texture"][varietal_enum],
+            "structure": _VARIETAL_COLUMNS["structure"][varietal_enum],
+            "climate_modifier": climate_mod["texture_modifier"],
+            "oak_overlay": oak_char["texture_overlay"],
+            "age_state": age_transform["texture_state"]
+        },
+        
+        "compositional_structure": {
+            "base_composition": _VARIETAL_COLUMNS["composition"][varietal_enum],
+            "style_aesthetic": style_mod["aesthetic"],
+            "visual_tension": None,
+            "integration": age_transform["integration"],
+            "edge_quality": _VARIETAL_COLUMNS["edge_quality"][varietal_enum],
+            "edge_treatment": climate_mod["edge_treatment"]
+        },
+        
+        "atmospheric_qualities": {
+            "climate_atmosphere": climate_mod["atmosphere"],
+            "style_atmosphere": style_mod["atmosphere"],
+            "finish_depth": None,
+            "fade_pattern": None,
+            "time_signature": age_transform["time_signature"]
+        },
+        
+        "material_references": {
+            "oak_materials": oak_char["material_reference"],
+            "finish_quality": oak_char["finish_quality"],
+            "age_patina": _AGE_PATINA[age_enum]
+        },
+        
+        "color_palette": {
+            "primary": _VARIETAL_COLUMNS["color_hue"][varietal_enum],
+            "aroma_palette": None,
+            "saturation_adjust": climate_mod["saturation_adjust"],
+            "brightness_adjust": climate_mod["brightness_adjust"],
+            "color_treatment": style_mod["color_treatment"]
+        },
+        
+        "aromatic_descriptors": {
+            "characteristic_notes": _VARIETAL_COLUMNS["characteristic_notes"][varietal_enum],
+            "aroma_category": age_transform["aromatic_category"],
+            "aroma_textures": None
+        }
+    })
+
+
+_CATEGORICAL_ENUMS = (Varietal, ClimateType, WinemakingStyle, OakTreatment, AgeCategory)
+
+# Keyed by interned raw string values so tool inputs never need Enum construction
+_CATEGORICAL_CACHE = {
+    tuple(sys.intern(member.value) for member in combo): _build_categorical(*combo)
+    for combo in product(*_CATEGORICAL_ENUMS)
+}
+
+
+# ============================================================================
+# VISUAL VOCABULARY RESULT
+# ============================================================================
+
+@dataclass(slots=True, frozen=True)
+class VisualVocabulary:
+    """Fixed-layout record of the sections that make up a visual vocabulary"""
+    base_color: Dict
+    opacity_clarity: Dict
+    texture_surface: Dict
+    compositional_structure: Dict
+    atmospheric_qualities: Dict
+    material_references: Dict
+    color_palette: Dict
+    aromatic_descriptors: Dict
+    balance_relationships: Dict
+    finish_dimension: Dict
+    metadata: Dict
+    
+    def to_dict(self) -> Dict:
+        """Materialize the nested-dict form returned over MCP"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _lookup_categorical(key: tuple) -> MappingProxyType:
+    """Return the precomputed sections for a lowercased 5-tuple key; raises ValueError on an unknown value."""
+    base = _CATEGORICAL_CACHE.get(key)
+    if base is None:
+        # Only parse through the enums to report which value was invalid
+        try:
+            for enum_cls, value in zip(_CATEGORICAL_ENUMS, key):
+                enum_cls(value)
+        except ValueError as e:
+            raise ValueError(f"Invalid parameter value: {e}") from None
+    return base
+
+
+def _categorical_sections(
+    varietal: str,
+    climate: str,
+    winemaking_style: str,
+    oak_treatment: str,
+    age: str
+) -> MappingProxyType:
+    """Return the precomputed enum-derived sections; raises ValueError on an unknown value."""
+    
+    # Look up the precomputed categorical sections by raw string values
+    return _lookup_categorical(
+        (varietal.lower(), climate.lower(), winemaking_style.lower(), oak_treatment.lower(), age.lower())
+    )
+
+
+# Only the first few aroma colors are reported, so stop collecting once full
+_AROMA_PALETTE_SIZE = 4
+
+
+@lru_cache(maxsize=512, typed=True)
+def _per_call_overlay(
+    acidity: float,
+    tannin: float,
+    sweetness: float,
+    alcohol: float,
+    body: float,
+    finish_length: str,
+    primary_aromas: tuple
+) -> MappingProxyType:
+    """Compute the fields driven by the numeric and aroma inputs rather than the enums.
+    
+    Memoized (typed, so 5 and 5.0 stay distinct in the echoed balance values);
+    the result is frozen because every caller shares it.
+    """
+    
+    # Score the balance profile once and map scores to descriptors
+    tension_score, weight_score = _balance_scores(acidity, tannin, body, alcohol)
+    visual_tension = _tension_descriptor(tension_score)
+    visual_weight = _weight_descriptor(weight_score)
+    
+    # Get finish characteristics
+    finish_char = FINISH_CHARACTERISTICS.get(finish_length, FINISH_CHARACTERISTICS["medium"])
+    
+    # Process aroma clusters
+    aroma_palette = []
+    aroma_descriptors = {}  # ordered set: first-seen order, no duplicates
+    if primary_aromas:
+        for aroma in primary_aromas:
+            # Find which clusters this aroma belongs to
+            for cluster_data in _NOTE_TO_CLUSTERS.get(aroma.lower(), ()):
+                if len(aroma_palette) < _AROMA_PALETTE_SIZE:
+                    aroma_palette.extend(cluster_data["color_palette"][:_AROMA_PALETTE_SIZE - len(aroma_palette)])
+                aroma_descriptors[cluster_data["brightness"]] = None
+                aroma_descriptors[cluster_data["texture"]] = None
+    
+    return _freeze({
+        "visual_tension": visual_tension,
+        "visual_weight": visual_weight,
+        "finish_depth": finish_char["atmospheric_depth"],
+        "fade_pattern": finish_char["fade_pattern"],
+        "aroma_palette": aroma_palette,
+        "aroma_textures": list(aroma_descriptors),
+        "balance_relationships": {
+            "acidity": acidity,
+            "tannin": tannin,
+            "sweetness": sweetness,
+            "alcohol": alcohol,
+            "body": body,
+            "visual_tension": visual_tension,
+            "visual_weight": visual_weight
+        },
+        "finish_dimension": {
+            "length": finish_length,
+            "descriptor": finish_char["length_descriptor"],
+            "edge_treatment": finish_char["edge_treatment"],
+            "fade_pattern": finish_char["fade_pattern"]
+        }
+    })
+
+
+def _assemble_visual_vocabulary(
+    base: MappingProxyType,
+    overlay: MappingProxyType,
+    metadata: Dict
+) -> VisualVocabulary:
+    """Overlay the per-call fields onto copies of the categorical sections"""
+    return VisualVocabulary(
+        base_color=dict(base["base_color"]),
+        
+        opacity_clarity={
+            **base["opacity_clarity"],
+            "visual_weight": overlay["visual_weight"]
+        },
+        
+        texture_surface=dict(base["texture_surface"]),
+        
+        compositional_structure={
+            **base["compositional_structure"],
+            "visual_tension": overlay["visual_tension"]
+        },
+        
+        atmospheric_qualities={
+            **base["atmospheric_qualities"],
+            "finish_depth": overlay["finish_depth"],
+            "fade_pattern": overlay["fade_pattern"]
+        },
+        
+        material_references=dict(base["material_references"]),
+        
+        color_palette={
+            **base["color_palette"],
+            "aroma_palette": list(overlay["aroma_palette"])
+        },
+        
+        aromatic_descriptors={
+            **base["aromatic_descriptors"],
+            "aroma_textures": list(overlay["aroma_textures"])
+        },
+        
+        balance_relationships=dict(overlay["balance_relationships"]),
+        
+        finish_dimension=dict(overlay["finish_dimension"]),
+        
+        metadata=metadata
+    )
+
+
+def _build_visual_vocabulary(
+    varietal: str,
+    climate: str = "moderate",
+    winemaking_style: str = "old_world",
+    oak_treatment: str = "french_oak",
+    age: str = "developing",
+    acidity: float = 5.0,
+    tannin: float = 5.0,
+    sweetness: float = 2.0,
+    alcohol: float = 6.0,
+    body: float = 6.0,
+    finish_length: str = "medium",
+    primary_aromas: Optional[List[str]] = None
+) -> VisualVocabulary:
+    """Build the visual vocabulary record; raises ValueError on an unknown enum value."""
+    base = _categorical_sections(varietal, climate, winemaking_style, oak_treatment, age)
+    overlay = _per_call_overlay(
+        acidity, tannin, sweetness, alcohol, body, finish_length,
+        tuple(primary_aromas) if primary_aromas else ()
+    )
+    return _assemble_visual_vocabulary(base, overlay, {
+        "varietal": varietal,
+        "climate": climate,
+        "winemaking_style": winemaking_style,
+        "oak_treatment": oak_treatment,
+        "age_category": age
+    })
+
+
+def generate_wine_visual_vocabulary(
+    varietal: str,
+    climate: str = "moderate",
+    winemaking_style: str = "old_world",
+    oak_treatment: str = "french_oak",
+    age: str = "developing",
+    acidity: float = 5.0,
+    tannin: float = 5.0,
+    sweetness: float = 2.0,
+    alcohol: float = 6.0,
+    body: float = 6.0,
+    finish_length: str = "medium",
+    primary_aromas: Optional[List[str]] = None
+) -> Dict:
+    """
+    Generate complete visual vocabulary from wine tasting parameters.
+    
+    This is the primary morphism that composes all categorical structures
+    into a unified visual parameter set for image generation.
+    
+    Args:
+        varietal: Grape variety (e.g., "pinot_noir", "chardonnay")
+        climate: Growing climate ("cool", "moderate", "warm", "hot")
+        winemaking_style: Production approach ("old_world", "new_world")
+        oak_treatment: Oak aging type ("none", "neutral", "french_oak", "american_oak", "mixed_oak")
+        age: Wine age category ("youthful", "developing", "mature", "past_prime")
+        acidity: Acid level 1-10 (higher = brighter, more angular)
+        tannin: Tannin level 1-10 (reds only, higher = more structured)
+        sweetness: Sugar level 1-10 (higher = richer, softer)
+        alcohol: Alcohol level 1-10 (higher = warmer, fuller)
+        body: Body weight 1-10 (higher = denser, heavier)
+        finish_length: Persistence ("short", "medium", "long", "very_long")
+        primary_aromas: List of dominant aroma descriptors (optional)
+    
+    Returns:
+        Complete visual vocabulary dictionary with all parameters
+    """
+    
+    try:
+        vocabulary = _build_visual_vocabulary(
+            varietal, climate, winemaking_style, oak_treatment, age,
+            acidity, tannin, sweetness, alcohol, body,
+            finish_length, primary_aromas
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    return vocabulary.to_dict()
+
+
+# (output key, vocabulary section, field within the section or None for all of it)
+_CONTRAST_FIELDS = (
+    ("color_contrast", "base_color", None),
+    ("texture_contrast", "texture_surface", "base_texture"),
+    ("weight_contrast", "opacity_clarity", "visual_weight"),
+    ("atmospheric_contrast", "atmospheric_qualities", None),
+)
+
+
+def compare_wine_profiles(
+    wine1_params: Dict,
+    wine2_params: Dict
+) -> Dict:
+    """
+    Compare two wine profiles to identify visual contrasts and similarities.
+    
+    Useful for creating comparative visualizations or understanding how
+    different wines would look different visually.
+    
+    Args:
+        wine1_params: Parameters for first wine (same as generate_wine_visual_vocabulary)
+        wine2_params: Parameters for second wine
+    
+    Returns:
+        Comparison analysis with contrasts and similarities
+    """
+    
+    # Build the slotted records directly; no need for the dict form here
+    vocab1 = _build_visual_vocabulary(**wine1_params)
+    vocab2 = _build_visual_vocabulary(**wine2_params)
+    
+    # Side-by-side fields come from one pass over the contrast table
+    comparison = {}
+    for contrast, section, key in _CONTRAST_FIELDS:
+        value1 = getattr(vocab1, section)
+        value2 = getattr(vocab2, section)
+        if key is not None:
+            value1 = value1[key]
+            value2 = value2[key]
+        comparison[contrast] = {"wine1": value1, "wine2": value2}
+    
+    br1, br2 = vocab1.balance_relationships, vocab2.balance_relationships
+    hue_differs = vocab1.base_color["hue"] != vocab2.base_color["hue"]
+    
+    comparison["color_contrast"]["difference"] = "significant" if hue_differs else "subtle"
+    comparison["texture_contrast"]["structural_difference"] = (
+        f"{vocab1.texture_surface['structure']} vs {vocab2.texture_surface['structure']}"
+    )
+    comparison["balance_comparison"] = {
+        "wine1_tension": br1["visual_tension"],
+        "wine2_tension": br2["visual_tension"],
+        "wine1_weight": br1["visual_weight"],
+        "wine2_weight": br2["visual_weight"]
+    }
+    
+    return comparison
+
+
+def _build_varietal_summary() -> Dict:
+    """Summarize each varietal's basic characteristics for get_varietal_list"""
+    varietal_info = {}
+    
+    for varietal in Varietal:
+        varietal_info[varietal.value] = {
+            "color": _VARIETAL_COLUMNS["color_base"][varietal],
+            "texture": _VARIETAL_COLUMNS["texture"][varietal],
+            "structure": _VARIETAL_COLUMNS["structure"][varietal],
+            "notes": _VARIETAL_COLUMNS["characteristic_notes"][varietal]
+        }
+    
+    return varietal_info
+
+
+# The source tables are frozen, so the summary is built once and kept read-only
+_VARIETAL_SUMMARY = _freeze(_build_varietal_summary())
+
+
+def get_varietal_list() -> Dict:
+    """
+    Get list of all supported wine varietals with their basic characteristics.
+    
+    Returns:
+        Dictionary of varietals with descriptive info
+    """
+    # Plain dicts for MCP serialization; callers may mutate without touching the cache
+    return {name: dict(info) for name, info in _VARIETAL_SUMMARY.items()}
+
+
+def get_aroma_clusters() -> Dict:
+    """
+    Get all aroma/flavor clusters with their visual characteristics.
+    
+    Returns:
+        Dictionary of aroma clusters with color palettes and descriptors
+    """
+    return AROMA_CLUSTERS
+
+
+# Typical parameters for classic regions, built once at import
+_REGION_PRESETS = _freeze({
+    "burgundy_red": {
+        "varietal": "pinot_noir",
+        "climate": "cool",
+        "winemaking_style": "old_world",
+        "oak_treatment": "french_oak",
+        "age": "developing",
+        "acidity": 7.5,
+        "tannin": 6.0,
+        "sweetness": 2.0,
+        "alcohol": 6.5,
+        "body": 5.5,
+        "finish_length": "long",
+        "primary_aromas": ["cherry", "mushroom", "rose"]
+    },
+    
+    "burgundy_white": {
+        "varietal": "chardonnay",
+        "climate": "cool",
+        "winemaking_style": "old_world",
+        "oak_treatment": "french_oak",
+        "age": "developing",
+        "acidity": 7.0,
+        "tannin": 0.0,
+        "sweetness": 2.0,
+        "alcohol": 6.5,
+        "body": 7.0,
+        "finish_length": "long",
+        "primary_aromas": ["apple", "hazelnut", "toast"]
+    },
+    
+    "napa_cabernet": {
+        "varietal": "cabernet_sauvignon",
+        "climate": "warm",
+        "winemaking_style": "new_world",
+        "oak_treatment": "american_oak",
+        "age": "youthful",
+        "acidity": 5.5,
+        "tannin": 8.5,
+        "sweetness": 2.5,
+        "alcohol": 8.5,
+        "body": 9.0,
+        "finish_length": "very_long",
+        "primary_aromas": ["blackcurrant", "vanilla", "cedar"]
+    },
+    
+    "rioja_tempranillo": {
+        "varietal": "tempranillo",
+        "climate": "moderate",
+        "winemaking_style": "old_world",
+        "oak_treatment": "american_oak",
+        "age": "mature",
+        "acidity": 6.0,
+        "tannin": 6.5,
+        "sweetness": 2.0,
+        "alcohol": 6.5,
+        "body": 6.5,
+        "finish_length": "medium",
+        "primary_aromas": ["cherry", "leather", "vanilla", "dried_herbs"]
+    },
+    
+    "mosel_riesling": {
+        "varietal": "riesling",
+        "climate": "cool",
+        "winemaking_style": "old_world",
+        "oak_treatment": "none",
+        "age": "youthful",
+        "acidity": 9.0,
+        "tannin": 0.0,
+        "sweetness": 4.0,
+        "alcohol": 4.5,
+        "body": 4.0,
+        "finish_length": "long",
+        "primary_aromas": ["lime", "slate", "petrol"]
+    },
+    
+    "barolo": {
+        "varietal": "nebbiolo",
+        "climate": "moderate",
+        "winemaking_style": "old_world",
+        "oak_treatment": "neutral",
+        "age": "mature",
+        "acidity": 8.5,
+        "tannin": 9.0,
+        "sweetness": 1.5,
+        "alcohol": 7.5,
+        "body": 7.0,
+        "finish_length": "very_long",
+        "primary_aromas": ["rose", "tar", "truffle", "dried_cherry"]
+    },
+    
+    "rhone_syrah": {
+        "varietal": "syrah",
+        "climate": "moderate",
+        "winemaking_style": "old_world",
+        "oak_treatment": "french_oak",
+        "age": "developing",
+        "acidity": 6.0,
+        "tannin": 7.5,
+        "sweetness": 2.0,
+        "alcohol": 7.0,
+        "body": 8.0,
+        "finish_length": "long",
+        "primary_aromas": ["blackberry", "pepper", "smoke"]
+    },
+    
+    "marlborough_sauvignon": {
+        "varietal": "sauvignon_blanc",
+        "climate": "cool",
+        "winemaking_style": "new_world",
+        "oak_treatment": "none",
+        "age": "youthful",
+        "acidity": 8.5,
+        "tannin": 0.0,
+        "sweetness": 1.5,
+        "alcohol": 6.0,
+        "body": 5.0,
+        "finish_length": "medium",
+        "primary_aromas": ["grapefruit", "grass", "gooseberry"]
+    }
+})
+
+
+def create_regional_preset(
+    region: str
+) -> Dict:
+    """
+    Generate visual vocabulary for classic wine regions with typical characteristics.
+    
+    Supports major wine regions with their characteristic styles.
+    
+    Args:
+        region: Wine region name (e.g., "burgundy", "napa", "rioja", "mosel")
+    
+    Returns:
+        Pre-configured parameters for that region's typical wines
+    """
+    
+    region_lower = region.lower().replace(" ", "_")
+    
+    if region_lower in _REGION_PRESETS:
+        params = _REGION_PRESETS[region_lower]
+        vocab = generate_wine_visual_vocabulary(**params)
+        vocab["regional_preset"] = region
+        return vocab
+    else:
+        return {
+            "error": f"Region '{region}' not found",
+            "available_regions": list(_REGION_PRESETS.keys())
+        }
+
+
+# ============================================================================
+# STRATEGIC ANALYSIS (Tomographic Domain Projection)
+# ============================================================================
+
+STRATEGIC_PATTERNS = {
+    "balance_integration": {
+        "well_balanced": {
+            "patterns": [
+                r"well[- ]balanced", r"harmonious", r"coherent", r"integrated",
+                r"unified", r"complement(?:ary|ing)", r"synerg(?:y|istic)",
+                r"align(?:ed|ment)"
+            ],
+            "threshold": 4,
+            "confidence": 0.8
+        },
+        "acidic_harsh": {
+            "patterns": [
+                r"harsh", r"acidic", r"sharp", r"bitter", r"conflict(?:ing|s)",
+                r"tension", r"discord", r"contradict"
+            ],
+            "threshold": 3,
+            "confidence": 0.75
+        },
+        "flabby_unfocused": {
+            "patterns": [
+                r"flabb", r"unfocused", r"diffuse", r"lack.*direction",
+                r"unclear", r"vague", r"scattered", r"incoherent"
+            ],
+            "threshold": 3,
+            "confidence": 0.75
+        },
+        "tannic_rigid": {
+            "patterns": [
+                r"rigid", r"inflexible", r"tannic", r"harsh.*structure",
+                r"over.*constrain", r"restrictive", r"bureaucratic"
+            ],
+            "threshold": 4,
+            "confidence": 0.7
+        }
+    },
+    "temporal_maturity": {
+        "youthful_premature": {
+            "patterns": [
+                r"premature", r"rushed", r"immature", r"under.*developed",
+                r"too.*early", r"not.*ready", r"incomplete"
+            ],
+            "threshold": 3,
+            "confidence": 0.8
+        },
+        "developing_integration": {
+            "patterns": [
+                r"developing", r"evolving", r"maturing", r"progress(?:ing|ion)",
+                r"phase", r"transition", r"emerging"
+            ],
+            "threshold": 3,
+            "confidence": 0.75
+        },
+        "mature_refined": {
+            "patterns": [
+                r"mature", r"refined", r"seasoned", r"established",
+                r"proven", r"sophisticated", r"well.*developed"
+            ],
+            "threshold": 3,
+            "confidence": 0.8
+        },
+        "past_prime_outdated": {
+            "patterns": [
+                r"outdated", r"stale", r"past.*prime", r"declining",
+                r"obsolete", r"legacy.*burden", r"over.*mature"
+            ],
+            "threshold": 2,
+            "confidence": 0.85
+        }
+    },
+    "strategic_substance": {
+        "light_insufficient": {
+            "patterns": [
+                r"insufficient", r"thin", r"weak", r"inadequate",
+                r"under.*resource", r"lack.*substance", r"superficial"
+            ],
+            "threshold": 3,
+            "confidence": 0.75
+        },
+        "full_bodied": {
+            "patterns": [
+                r"substantial", r"robust", r"strong", r"full(?:y|-)resource",
+                r"comprehensive", r"thorough", r"well.*supported"
+            ],
+            "threshold": 4,
+            "confidence": 0.8
+        },
+        "overweight_bloated": {
+            "patterns": [
+                r"bloat(?:ed)?", r"excessive", r"over.*resource",
+                r"too.*complex", r"unwieldy", r"over.*built"
+            ],
+            "threshold": 3,
+            "confidence": 0.75
+        }
+    },
+    "persistence_planning": {
+        "short_tactical": {
+            "patterns": [
+                r"short[- ]term", r"tactical", r"immediate", r"quick.*win",
+                r"near[- ]term", r"reactive", r"ad[- ]hoc"
+            ],
+            "threshold": 4,
+            "confidence": 0.8
+        },
+        "medium_balanced": {
+            "patterns": [
+                r"medium[- ]term", r"balanced.*horizon", r"phased",
+                r"staged", r"incremental", r"quarterly"
+            ],
+            "threshold": 3,
+            "confidence": 0.75
+        },
+        "long_strategic": {
+            "patterns": [
+                r"long[- ]term", r"strategic", r"sustained", r"enduring",
+                r"multi[- ]year", r"persistent", r"lasting.*impact"
+            ],
+            "threshold": 3,
+            "confidence": 0.8
+        },
+        "very_long_visionary": {
+            "patterns": [
+                r"visionary", r"transformational", r"decade", r"generational",
+                r"legacy", r"fundamental.*shift", r"paradigm"
+            ],
+            "threshold": 2,
+            "confidence": 0.85
+        }
+    }
+}
+
+# Each detector regex compiled once; patterns are still scanned individually so
+# a word hit by two patterns (e.g. "harsh" and "harsh.*structure") counts twice
+_STRATEGIC_REGEXES = {
+    dimension: {
+        pattern_name: tuple(re.compile(regex, re.IGNORECASE) for regex in pattern_spec["patterns"])
+        for pattern_name, pattern_spec in patterns.items()
+    }
+    for dimension, patterns in STRATEGIC_PATTERNS.items()
+}
+
+
+# Categorical family reported by each dimension's findings, in detector order
+_STRATEGIC_FAMILIES = {
+    "balance_integration": "constraints",
+    "temporal_maturity": "morphisms",
+    "strategic_substance": "objects",
+    "persistence_planning": "morphisms"
+}
+
+
+def _detect_dimension(text: str, dimension: str) -> list:
+    """Run every pattern of one strategic dimension over the text."""
+    findings = []
+    regexes = _STRATEGIC_REGEXES[dimension]
+    
+    for pattern_name, pattern_spec in STRATEGIC_PATTERNS[dimension].items():
+        # Only the match count and the first five matches are reported
+        match_count = 0
+        evidence = []
+        for regex in regexes[pattern_name]:
+            found = regex.findall(text)
+            match_count += len(found)
+            if len(evidence) < 5:
+                evidence.extend(found[:5 - len(evidence)])
+        
+        if match_count >= pattern_spec["threshold"]:
+            findings.append({
+                "dimension": dimension,
+                "pattern": pattern_name,
+                "confidence": pattern_spec["confidence"],
+                "evidence": evidence,
+                "categorical_family": _STRATEGIC_FAMILIES[dimension]
+            })
+    
+    return findings
+
+
+def detect_balance_integration(text: str) -> list:
+    """Detect strategic coherence patterns (constraints family)."""
+    return _detect_dimension(text, "balance_integration")
+
+
+def detect_temporal_maturity(text: str) -> list:
+    """Detect maturity/timing patterns (morphisms family)."""
+    return _detect_dimension(text, "temporal_maturity")
+
+
+def detect_strategic_substance(text: str) -> list:
+    """Detect resource commitment patterns (objects family)."""
+    return _detect_dimension(text, "strategic_substance")
+
+
+def detect_persistence_planning(text: str) -> list:
+    """Detect long-term thinking patterns (morphisms family)."""
+    return _detect_dimension(text, "persistence_planning")
+
+
+# Findings per document, keyed by a content digest so large texts are not
+# retained as cache keys; oldest entries are evicted first
+_STRATEGY_CACHE_SIZE = 128
+_STRATEGY_FINDINGS_CACHE: Dict[bytes, tuple] = {}
+
+
+def _strategy_findings(strategy_text: str) -> tuple:
+    """Scan a document once per distinct content and cache the findings."""
+    digest = hashlib.blake2b(strategy_text.encode("utf-8"), digest_size=16).digest()
+    findings = _STRATEGY_FINDINGS_CACHE.get(digest)
+    if findings is None:
+        all_findings = []
+        
+        # Run all four detectors in one sweep over the dimension table
+        for dimension in _STRATEGIC_FAMILIES:
+            all_findings.extend(_detect_dimension(strategy_text, dimension))
+        
+        # Filter by confidence threshold
+        confidence_threshold = 0.6
+        findings = tuple(f for f in all_findings if f["confidence"] >= confidence_threshold)
+        
+        if len(_STRATEGY_FINDINGS_CACHE) >= _STRATEGY_CACHE_SIZE:
+            del _STRATEGY_FINDINGS_CACHE[next(iter(_STRATEGY_FINDINGS_CACHE))]
+        _STRATEGY_FINDINGS_CACHE[digest] = findings
+    return findings
+
+
+def analyze_strategy_document(strategy_text: str) -> Dict[str, Any]:
+    """
+    Analyze strategy document through wine tasting lens.
+    
+    Pure deterministic pattern matching - zero LLM cost.
+    Projects strategy through wine vocabulary to detect structural patterns.
+    """
+    # Copy cached findings so callers never share mutable state
+    filtered_findings = [
+        {**finding, "evidence": list(finding["evidence"])}
+        for finding in _strategy_findings(strategy_text)
+    ]
+    
+    return {
+        "domain": "wine_tasting",
+        "findings": filtered_findings,
+        "total_findings": len(filtered_findings),
+        "methodology": "deterministic_pattern_matching",
+        "llm_cost_tokens": 0
+    }
+
+
+def evolution_sequence(
+    varietal: str,
+    climate: str = "moderate",
+    winemaking_style: str = "old_world",
+    oak_treatment: str = "french_oak",
+    acidity: float = 6.0,
+    tannin: float = 6.0,
+    sweetness: float = 2.0,
+    alcohol: float = 6.5,
+    body: float = 6.5,
+    finish_length: str = "long"
+) -> Dict:
+    """
+    Generate a temporal sequence showing how a wine evolves visually over time.
+    
+    Creates visual vocabularies for the same wine at different age stages,
+    showing the categorical transformation over time.
+    
+    Args:
+        (Same base parameters as generate_wine_visual_vocabulary, minus age)
+    
+    Returns:
+        Dictionary with visual vocabularies at each age stage
+    """
+    
+    # Only the categorical sections change with age; score everything else once
+    overlay = _per_call_overlay(acidity, tannin, sweetness, alcohol, body, finish_length, ())
+    key_prefix = (varietal.lower(), climate.lower(), winemaking_style.lower(), oak_treatment.lower())
+    
+    sequence = {}
+    
+    for age in ["youthful", "developing", "mature", "past_prime"]:
+        try:
+            base = _lookup_categorical(key_prefix + (age,))
+        except ValueError as e:
+            sequence[age] = {"error": str(e)}
+            continue
+        sequence[age] = _assemble_visual_vocabulary(base, overlay, {
+            "varietal": varietal,
+            "climate": climate,
+            "winemaking_style": winemaking_style,
+            "oak_treatment": oak_treatment,
+            "age_category": age
+        }).to_dict()
+    
+    return {
+        "evolution_sequence": sequence,
+        "key_transformations": {
+            "color": "purple/pale → garnet/gold → brick/amber → brown",
+            "texture": "taut → integrating → silky → thin",
+            "aromatics": "primary → secondary → tertiary → fading",
+            "clarity": "brilliant → bright → clear → dull"
+        }
+    }
+
+
+# ============================================================================
+# PHASE 2.6 - NORMALIZED PARAMETER SPACE & RHYTHMIC PRESETS
+# ============================================================================
+# Wine tasting aesthetic morphospace: 5 normalized dimensions [0.0, 1.0]
+#
+# structural_tension:  Acidity + tannin grip → angular/taut vs soft/round
+# color_depth:         Opacity, saturation, darkness of visual impression
+# aromatic_complexity: Primary/simple → tertiary/layered development
+# textural_weight:     Light/ethereal → full/dense body and viscosity
+# temporal_maturity:   Youthful/bright → aged/evolved patina
+# ============================================================================
+
+import math
+
+WINE_PARAMETER_NAMES = [
+    "structural_tension",
+    "color_depth",
+    "aromatic_complexity",
+    "textural_weight",
+    "temporal_maturity"
+]
+
+# Pulls all five parameters out of a state dict in one C-level call
+_PARAM_GET = itemgetter(*WINE_PARAMETER_NAMES)
+
+# Canonical wine states in normalized 5D morphospace
+WINE_TASTING_COORDS = {
+    "young_burgundy": {
+        "structural_tension": 0.70,
+        "color_depth": 0.45,
+        "aromatic_complexity": 0.40,
+        "textural_weight": 0.40,
+        "temporal_maturity": 0.15
+    },
+    "aged_barolo": {
+        "structural_tension": 0.85,
+        "color_depth": 0.55,
+        "aromatic_complexity": 0.95,
+        "textural_weight": 0.65,
+        "temporal_maturity": 0.90
+    },
+    "napa_cabernet": {
+        "structural_tension": 0.60,
+        "color_depth": 0.95,
+        "aromatic_complexity": 0.50,
+        "textural_weight": 0.95,
+        "temporal_maturity": 0.20
+    },
+    "mosel_riesling": {
+        "structural_tension": 0.90,
+        "color_depth": 0.15,
+        "aromatic_complexity": 0.55,
+        "textural_weight": 0.15,
+        "temporal_maturity": 0.10
+    },
+    "rhone_syrah": {
+        "structural_tension": 0.55,
+        "color_depth": 0.90,
+        "aromatic_complexity": 0.65,
+        "textural_weight": 0.85,
+        "temporal_maturity": 0.35
+    },
+    "champagne_brut": {
+        "structural_tension": 0.80,
+        "color_depth": 0.20,
+        "aromatic_complexity": 0.60,
+        "textural_weight": 0.25,
+        "temporal_maturity": 0.30
+    },
+    "sauternes": {
+        "structural_tension": 0.35,
+        "color_depth": 0.75,
+        "aromatic_complexity": 0.90,
+        "textural_weight": 0.80,
+        "temporal_maturity": 0.70
+    }
+}
+
+# Phase 2.6 rhythmic preset definitions
+WINE_RHYTHMIC_PRESETS = {
+    "aging_evolution": {
+        "state_a": "young_burgundy",
+        "state_b": "aged_barolo",
+        "pattern": "sinusoidal",
+        "num_cycles": 3,
+        "steps_per_cycle": 24,
+        "description": "Temporal evolution from youthful vibrancy to aged complexity"
+    },
+    "weight_spectrum": {
+        "state_a": "mosel_riesling",
+        "state_b": "napa_cabernet",
+        "pattern": "triangular",
+        "num_cycles": 4,
+        "steps_per_cycle": 20,
+        "description": "Full sweep from crystalline delicacy to monumental density"
+    },
+    "terroir_pulse": {
+        "state_a": "young_burgundy",
+        "state_b": "rhone_syrah",
+        "pattern": "sinusoidal",
+        "num_cycles": 4,
+        "steps_per_cycle": 18,
+        "description": "Cool-climate finesse pulsing against warm-climate power"
+    },
+    "elegance_richness": {
+        "state_a": "champagne_brut",
+        "state_b": "sauternes",
+        "pattern": "sinusoidal",
+        "num_cycles": 5,
+        "steps_per_cycle": 15,
+        "description": "Taut effervescent precision cycling with honeyed opulence"
+    },
+    "structure_toggle": {
+        "state_a": "mosel_riesling",
+        "state_b": "aged_barolo",
+        "pattern": "square",
+        "num_cycles": 5,
+        "steps_per_cycle": 12,
+        "description": "Sharp alternation between crystalline youth and austere maturity"
+    }
+}
+
+# ============================================================================
+# PHASE 2.7 - VISUAL VOCABULARY & PROMPT GENERATION
+# ============================================================================
+# Visual types map canonical states to image-generation-ready keywords.
+# Nearest-neighbor matching translates any 5D coordinate to visual vocabulary.
+# ============================================================================
+
+WINE_VISUAL_TYPES = {
+    "burgundian_silk": {
+        "coords": {
+            "structural_tension": 0.70,
+            "color_depth": 0.45,
+            "aromatic_complexity": 0.40,
+            "textural_weight": 0.40,
+            "temporal_maturity": 0.15
+        },
+        "keywords": [
+            "translucent ruby glow",
+            "silk draped over fine bone structure",
+            "delicate cherry-rose luminescence",
+            "cool mineral transparency",
+            "intimate layered depth",
+            "precise elegant restraint",
+            "forest-floor earthiness"
+        ],
+        "optical_properties": {
+            "finish": "satin",
+            "transparency": "translucent",
+            "refraction": "soft diffused glow",
+            "dominant_palette": ["#8B2635", "#C71585", "#FFB6C1"]
+        }
+    },
+    "barolo_patina": {
+        "coords": {
+            "structural_tension": 0.85,
+            "color_depth": 0.55,
+            "aromatic_complexity": 0.95,
+            "textural_weight": 0.65,
+            "temporal_maturity": 0.90
+        },
+        "keywords": [
+            "aged garnet-brick translucence",
+            "tar and rose petal duality",
+            "noble austere architecture",
+            "chalky tannic grip texture",
+            "tertiary truffle complexity",
+            "time-weathered aristocratic patina",
+            "dried herb and leather warmth"
+        ],
+        "optical_properties": {
+            "finish": "matte chalky",
+            "transparency": "semi-translucent",
+            "refraction": "warm brick-edge glow",
+            "dominant_palette": ["#9B4F47", "#654321", "#8B4513"]
+        }
+    },
+    "napa_monument": {
+        "coords": {
+            "structural_tension": 0.60,
+            "color_depth": 0.95,
+            "aromatic_complexity": 0.50,
+            "textural_weight": 0.95,
+            "temporal_maturity": 0.20
+        },
+        "keywords": [
+            "deep opaque purple-black density",
+            "monumental architectural weight",
+            "charred oak and dark fruit saturation",
+            "bold commanding visual mass",
+            "velvety concentrated darkness",
+            "sun-drenched power and extract",
+            "polished new-oak sheen"
+        ],
+        "optical_properties": {
+            "finish": "lacquered",
+            "transparency": "opaque",
+            "refraction": "deep absorptive",
+            "dominant_palette": ["#2C1810", "#1A0F14", "#4A0E4E"]
+        }
+    },
+    "riesling_crystal": {
+        "coords": {
+            "structural_tension": 0.90,
+            "color_depth": 0.15,
+            "aromatic_complexity": 0.55,
+            "textural_weight": 0.15,
+            "temporal_maturity": 0.10
+        },
+        "keywords": [
+            "crystalline pale-straw luminosity",
+            "razor-sharp mineral precision",
+            "electric citrus-petrol clarity",
+            "taut wire-like structural tension",
+            "transparent slate-cold purity",
+            "brilliant star-bright refraction",
+            "weightless ethereal suspension"
+        ],
+        "optical_properties": {
+            "finish": "crystalline",
+            "transparency": "transparent",
+            "refraction": "prismatic brilliant",
+            "dominant_palette": ["#FFFACD", "#F5F5DC", "#BFFF00"]
+        }
+    },
+    "rhone_wildfire": {
+        "coords": {
+            "structural_tension": 0.55,
+            "color_depth": 0.90,
+            "aromatic_complexity": 0.65,
+            "textural_weight": 0.85,
+            "temporal_maturity": 0.35
+        },
+        "keywords": [
+            "inky purple-black smoke depth",
+            "wild untamed visceral power",
+            "cracked black pepper and smoked meat",
+            "primal dynamic dark energy",
+            "dense smoky atmospheric haze",
+            "garrigue herb-scrub earthiness",
+            "volcanic dark-fruit intensity"
+        ],
+        "optical_properties": {
+            "finish": "smoky matte",
+            "transparency": "near-opaque",
+            "refraction": "smouldering dark glow",
+            "dominant_palette": ["#1A0F14", "#2C1810", "#4A0E4E"]
+        }
+    },
+    "champagne_effervescence": {
+        "coords": {
+            "structural_tension": 0.80,
+            "color_depth": 0.20,
+            "aromatic_complexity": 0.60,
+            "textural_weight": 0.25,
+            "temporal_maturity": 0.30
+        },
+        "keywords": [
+            "pale gold effervescent sparkle",
+            "fine persistent bead streams",
+            "crisp autolytic biscuit elegance",
+            "taut mousse-like textural lift",
+            "luminous celebratory brightness",
+            "chalk-driven mineral backbone",
+            "precise toasty sophistication"
+        ],
+        "optical_properties": {
+            "finish": "effervescent",
+            "transparency": "translucent sparkling",
+            "refraction": "dancing light refractions",
+            "dominant_palette": ["#F4E4C1", "#FFD700", "#FFFACD"]
+        }
+    },
+    "sauternes_gold": {
+        "coords": {
+            "structural_tension": 0.35,
+            "color_depth": 0.75,
+            "aromatic_complexity": 0.90,
+            "textural_weight": 0.80,
+            "temporal_maturity": 0.70
+        },
+        "keywords": [
+            "deep amber-gold honeyed viscosity",
+            "botrytis noble-rot opulence",
+            "luscious apricot-saffron richness",
+            "unctuous coating glycerol weight",
+            "concentrated marmalade warmth",
+            "perfumed exotic dried-fruit layers",
+            "candied ginger and beeswax sheen"
+        ],
+        "optical_properties": {
+            "finish": "viscous glossy",
+            "transparency": "deep translucent",
+            "refraction": "warm amber diffusion",
+            "dominant_palette": ["#FFD700", "#FF8C00", "#DEB887"]
+        }
+    }
+}
+
+
+# Canonical states as one (states, parameters) matrix for batched interpolation
+_TASTING_STATE_INDEX = {state_id: i for i, state_id in enumerate(WINE_TASTING_COORDS)}
+_TASTING_STATE_COORDS = np.array(
+    [[coords[p] for p in WINE_PARAMETER_NAMES] for coords in WINE_TASTING_COORDS.values()],
+    dtype=np.float64
+)
+
+# Visual type coordinates as one (types, parameters) matrix for nearest-neighbor
+# search; rows follow WINE_VISUAL_TYPES order, columns WINE_PARAMETER_NAMES
+_VISUAL_TYPE_IDS = tuple(WINE_VISUAL_TYPES)
+_VISUAL_TYPE_INDEX = {type_id: i for i, type_id in enumerate(_VISUAL_TYPE_IDS)}
+_VISUAL_TYPE_COORDS = np.array(
+    [[WINE_VISUAL_TYPES[t]["coords"][p] for p in WINE_PARAMETER_NAMES] for t in _VISUAL_TYPE_IDS],
+    dtype=np.float64
+)
+
+# ============================================================================
+# PHASE 2.6 LAYER 2 - Deterministic Computation (0 tokens)
+# ============================================================================
+
+_TWO_PI = 2.0 * math.pi
+
+
+@lru_cache(maxsize=64, typed=True)
+def _generate_wine_oscillation(num_steps: int, num_cycles: int, pattern: str) -> np.ndarray:
+    """Generate oscillation envelope [0, 1].
+    
+    Memoized per (steps, cycles, pattern), so the array is returned read-only;
+    callers slice or concatenate it rather than writing in place. Counts must be
+    integers, as with range(); typed caching keeps 2.0 from hitting an entry for 2.
+    """
+    num_steps = index(num_steps)
+    num_cycles = index(num_cycles)
+    t = _TWO_PI * num_cycles * np.arange(num_steps) / num_steps
+    
+    if pattern == "sinusoidal":
+        envelope = 0.5 * (1.0 + np.sin(t))
+    elif pattern == "triangular":
+        t_norm = (t / _TWO_PI) % 1.0
+        envelope = np.where(t_norm < 0.5, 2.0 * t_norm, 2.0 * (1.0 - t_norm))
+    elif pattern == "square":
+        envelope = np.where((t / _TWO_PI) % 1.0 < 0.5, 0.0, 1.0)
+    else:
+        raise ValueError(f"Unknown pattern: {pattern}")
+    
+    envelope.setflags(write=False)
+    return envelope
+
+
+def _interpolate_wine_sequence(state_a_id: str, state_b_id: str, alphas: np.ndarray) -> np.ndarray:
+    """Interpolate between two wine states for every blend factor; one row per alpha."""
+    a = _TASTING_STATE_COORDS[_TASTING_STATE_INDEX[state_a_id]]
+    b = _TASTING_STATE_COORDS[_TASTING_STATE_INDEX[state_b_id]]
+    alpha_col = alphas[:, None]
+    return a * (1.0 - alpha_col) + b * alpha_col
+
+
+def _state_to_vector(state: dict) -> np.ndarray:
+    """Pack a parameter-state dict into a vector in WINE_PARAMETER_NAMES order."""
+    return np.array(_PARAM_GET(state), dtype=np.float64)
+
+
+def _state_to_dict(vector) -> dict:
+    """Unpack a state vector into the published dict form, rounded to 4 places."""
+    return {p: round(v, 4) for p, v in zip(WINE_PARAMETER_NAMES, vector)}
+
+
+def _euclidean_distance_wine(state1: dict, state2: dict) -> float:
+    """Euclidean distance between two wine parameter states."""
+    return math.sqrt(sum(
+        (v1 - v2) ** 2
+        for v1, v2 in zip(_PARAM_GET(state1), _PARAM_GET(state2))
+    ))
+
+
+if njit is not None:
+    @njit("Tuple((int64, float64))(float64[:], float64[:, :])", cache=True)
+    def _nearest_row(query, coords):
+        """Return (row index, distance) of the coords row closest to query."""
+        best = 0
+        best_sq = np.inf
+        for i in range(coords.shape[0]):
+            sq = 0.0
+            for j in range(coords.shape[1]):
+                diff = query[j] - coords[i, j]
+                sq += diff * diff
+            if sq < best_sq:  # strict, so the first of equal rows wins
+                best_sq = sq
+                best = i
+        return best, np.sqrt(best_sq)
+
+    @njit("Tuple((int64[:], float64[:]))(float64[:, :], float64[:, :])", cache=True)
+    def _nearest_rows(queries, coords):
+        """Batched _nearest_row: (row indices, distances) for every query row."""
+        n = queries.shape[0]
+        best = np.empty(n, dtype=np.int64)
+        distances = np.empty(n, dtype=np.float64)
+        for k in range(n):
+            best[k], distances[k] = _nearest_row(queries[k], coords)
+        return best, distances
+else:
+    def _nearest_row(query, coords):
+        """Return (row index, distance) of the coords row closest to query."""
+        distances = np.sqrt(((coords - query) ** 2).sum(axis=1))
+        idx = int(np.argmin(distances))  # first minimum, matching the strict-< scan
+        return idx, distances[idx]
+
+    def _nearest_rows(queries, coords):
+        """Batched _nearest_row: (row indices, distances) for every query row."""
+        distances = np.sqrt(((queries[:, None, :] - coords[None, :, :]) ** 2).sum(axis=2))
+        best = distances.argmin(axis=1)
+        return best, distances[np.arange(len(best)), best]
+
+
+def _find_nearest_wine_visual_type(state: dict) -> tuple:
+    """Find nearest visual type by Euclidean distance. Returns (type_id, distance)."""
+    idx, distance = _nearest_row(_state_to_vector(state), _VISUAL_TYPE_COORDS)
+    return _VISUAL_TYPE_IDS[idx], float(distance)
+
+
+def _generate_wine_preset_sequence(preset_name: str) -> list:
+    """Generate full oscillation sequence for a preset."""
+    preset = WINE_RHYTHMIC_PRESETS[preset_name]
+    total_steps = preset["num_cycles"] * preset["steps_per_cycle"]
+    alphas = _generate_wine_oscillation(total_steps, preset["num_cycles"], preset["pattern"])
+    
+    states = _interpolate_wine_sequence(preset["state_a"], preset["state_b"], alphas)
+    
+    sequence = []
+    for i, (alpha, state) in enumerate(zip(alphas.tolist(), states.tolist())):
+        sequence.append({
+            "step": i,
+            "phase": i / total_steps,
+            "blend_factor": round(alpha, 4),
+            "state": _state_to_dict(state)
+        })
+    return sequence
+
+
+# Preset sequences depend only on the preset table, so generate each one once;
+# tools only read and serialize them
+_PRESET_SEQUENCES = {
+    preset_name: _generate_wine_preset_sequence(preset_name)
+    for preset_name in WINE_RHYTHMIC_PRESETS
+}
+
+# The rounded step states of each preset as a (steps, parameters) matrix, so
+# keyframe selection can slice rows straight into the nearest-type kernel
+_PRESET_STATE_MATRICES = {
+    preset_name: np.array(
+        [_PARAM_GET(step["state"]) for step in sequence], dtype=np.float64
+    ).reshape(-1, len(WINE_PARAMETER_NAMES))
+    for preset_name, sequence in _PRESET_SEQUENCES.items()
+}
+
+# ============================================================================
+# PHASE 2.6 MCP TOOLS
+# ============================================================================
+
+def _build_wine_tasting_types_json() -> str:
+    """Serialize the visual type overview returned by get_wine_tasting_types"""
+    result = {}
+    for type_id, data in WINE_VISUAL_TYPES.items():
+        result[type_id] = {
+            "coords": data["coords"],
+            "keyword_preview": data["keywords"][:3],
+            "optical_finish": data["optical_properties"]["finish"]
+        }
+    return _dumps(result, indent=True)
+
+
+def _build_wine_tasting_specification_json(wine_type_id: str) -> str:
+    """Serialize one visual type's full specification"""
+    data = WINE_VISUAL_TYPES[wine_type_id]
+    return _dumps({
+        "type_id": wine_type_id,
+        "parameter_coordinates": data["coords"],
+        "visual_keywords": data["keywords"],
+        "optical_properties": data["optical_properties"],
+        "parameter_names": WINE_PARAMETER_NAMES
+    }, indent=True)
+
+
+# Layer 1 lookups depend only on the constant tables, so serialize them once
+_WINE_TASTING_TYPES_JSON = _build_wine_tasting_types_json()
+_WINE_TASTING_SPECIFICATIONS_JSON = {
+    type_id: _build_wine_tasting_specification_json(type_id)
+    for type_id in WINE_VISUAL_TYPES
+}
+
+
+def get_wine_tasting_types() -> str:
+    """
+    List all 7 canonical wine tasting visual types with descriptions.
+
+    Layer 1: Pure taxonomy lookup (0 tokens)
+
+    Returns:
+        JSON mapping wine type IDs to their 5D parameter coordinates
+        and human-readable descriptions.
+    """
+    return _WINE_TASTING_TYPES_JSON
+
+
+def get_wine_tasting_specifications(wine_type_id: str) -> str:
+    """
+    Get complete visual specifications for a wine tasting type.
+
+    Layer 1: Pure taxonomy lookup (0 tokens)
+
+    Args:
+        wine_type_id: One of the 7 canonical wine types
+            (burgundian_silk, barolo_patina, napa_monument,
+             riesling_crystal, rhone_wildfire, champagne_effervescence,
+             sauternes_gold)
+
+    Returns:
+        Complete visual vocabulary, optical properties, and parameter coordinates.
+    """
+    if wine_type_id not in _WINE_TASTING_SPECIFICATIONS_JSON:
+        available = _VISUAL_TYPE_IDS
+        return _dumps({"error": f"Unknown type '{wine_type_id}'", "available": available})
+
+    return _WINE_TASTING_SPECIFICATIONS_JSON[wine_type_id]
+
+
+def map_wine_tasting_parameters(
+    wine_type_id: str,
+    intensity: str = "moderate",
+    emphasis: str = "finish"
+) -> str:
+    """
+    Map wine type to visual parameters for image generation.
+
+    Layer 2: Deterministic operation (0 tokens)
+
+    Args:
+        wine_type_id: Which wine type (burgundian_silk, barolo_patina, etc.)
+        intensity: "subtle", "moderate", or "dramatic"
+        emphasis: "finish", "texture", "color", "aroma", or "structure"
+
+    Returns:
+        Complete parameter set for visual synthesis including vocabulary
+        weighted by intensity and emphasis.
+    """
+    if wine_type_id not in WINE_VISUAL_TYPES:
+        available = _VISUAL_TYPE_IDS
+        return _dumps({"error": f"Unknown type '{wine_type_id}'", "available": available})
+
+    data = WINE_VISUAL_TYPES[wine_type_id]
+
+    # Intensity multipliers
+    intensity_map = {"subtle": 0.5, "moderate": 1.0, "dramatic": 1.5}
+    mult = intensity_map.get(intensity, 1.0)
+
+    # Emphasis selects which keywords get boosted
+    emphasis_keyword_indices = {
+        "finish": [0, 5],     # first and structural keywords
+        "texture": [1, 3],    # texture-related keywords
+        "color": [0, 2],      # color keywords
+        "aroma": [2, 4, 5],   # aromatic / complexity keywords
+        "structure": [1, 3, 5] # structural keywords
+    }
+    boosted = emphasis_keyword_indices.get(emphasis, [0])
+
+    weighted_keywords = []
+    for i, kw in enumerate(data["keywords"]):
+        weight = mult * (1.5 if i in boosted else 1.0)
+        weighted_keywords.append({"keyword": kw, "weight": round(weight, 2)})
+
+    return _dumps({
+        "wine_type": wine_type_id,
+        "intensity": intensity,
+        "emphasis": emphasis,
+        "parameter_coordinates": data["coords"],
+        "weighted_keywords": weighted_keywords,
+        "optical_properties": data["optical_properties"]
+    }, indent=True)
+
+
+def compute_wine_tasting_distance(wine_type_id_1: str, wine_type_id_2: str) -> str:
+    """
+    Compute distance between two wine tasting types.
+
+    Layer 2: Pure distance computation (0 tokens)
+
+    Args:
+        wine_type_id_1: First wine type
+        wine_type_id_2: Second wine type
+
+    Returns:
+        Distance value and per-parameter breakdown.
+    """
+    if wine_type_id_1 not in WINE_VISUAL_TYPES or wine_type_id_2 not in WINE_VISUAL_TYPES:
+        return _dumps({"error": "Unknown wine type(s)",
+                           "available": _VISUAL_TYPE_IDS})
+
+    c1 = WINE_VISUAL_TYPES[wine_type_id_1]["coords"]
+    c2 = WINE_VISUAL_TYPES[wine_type_id_2]["coords"]
+
+    per_param = {p: round(abs(c1[p] - c2[p]), 4) for p in WINE_PARAMETER_NAMES}
+    total = round(_euclidean_distance_wine(c1, c2), 4)
+
+    return _dumps({
+        "wine_type_1": wine_type_id_1,
+        "wine_type_2": wine_type_id_2,
+        "euclidean_distance": total,
+        "per_parameter": per_param
+    }, indent=True)
+
+
+def compute_wine_tasting_trajectory(
+    start_wine_type_id: str,
+    end_wine_type_id: str,
+    num_steps: int = 20,
+    columnar: bool = False
+) -> str:
+    """
+    Compute smooth trajectory between two wine types in morphospace.
+
+    Layer 2: Deterministic trajectory integration (0 tokens)
+
+    Enables visualization of smooth aesthetic transitions — e.g.
+    young Burgundy gradually becoming aged Barolo.
+
+    Args:
+        start_wine_type_id: Starting wine type
+        end_wine_type_id: Target wine type
+        num_steps: Number of interpolation steps (default: 20)
+        columnar: Return the trajectory as parallel per-field arrays, with
+            each state a list in parameter_names order (default: False,
+            one record per step)
+
+    Returns:
+        Trajectory with intermediate states, distance profile,
+        and transition characteristics.
+    """
+    if start_wine_type_id not in WINE_VISUAL_TYPES or end_wine_type_id not in WINE_VISUAL_TYPES:
+        return _dumps({"error": "Unknown wine type(s)",
+                           "available": _VISUAL_TYPE_IDS})
+
+    start = WINE_VISUAL_TYPES[start_wine_type_id]["coords"]
+    end = WINE_VISUAL_TYPES[end_wine_type_id]["coords"]
+    total_dist = _euclidean_distance_wine(start, end)
+
+    # Interpolate every step at once, then match all rounded states in one batch
+    start_vec = _VISUAL_TYPE_COORDS[_VISUAL_TYPE_INDEX[start_wine_type_id]]
+    end_vec = _VISUAL_TYPE_COORDS[_VISUAL_TYPE_INDEX[end_wine_type_id]]
+    ts = [i / num_steps for i in range(num_steps + 1)]
+    t_col = np.array(ts, dtype=np.float64)[:, None]
+    raw_states = start_vec * (1.0 - t_col) + end_vec * t_col
+    states = [[round(v, 4) for v in row] for row in raw_states.tolist()]
+    nearest_idx, nearest_dist = _nearest_rows(
+        np.array(states, dtype=np.float64).reshape(-1, len(WINE_PARAMETER_NAMES)),
+        _VISUAL_TYPE_COORDS
+    )
+
+    if columnar:
+        trajectory = {
+            "parameter_names": WINE_PARAMETER_NAMES,
+            "step": list(range(len(ts))),
+            "t": [round(t, 3) for t in ts],
+            "state": states,
+            "nearest_visual_type": [_VISUAL_TYPE_IDS[i] for i in nearest_idx.tolist()],
+            "distance_to_nearest": [round(d, 4) for d in nearest_dist.tolist()]
+        }
+    else:
+        trajectory = []
+        for i, t in enumerate(ts):
+            trajectory.append({
+                "step": i,
+                "t": round(t, 3),
+                "state": _state_to_dict(states[i]),
+                "nearest_visual_type": _VISUAL_TYPE_IDS[nearest_idx[i]],
+                "distance_to_nearest": round(float(nearest_dist[i]), 4)
+            })
+
+    # Characterize transition
+    biggest_change_param = WINE_PARAMETER_NAMES[int(np.abs(end_vec - start_vec).argmax())]
+
+    return _dumps({
+        "start": start_wine_type_id,
+        "end": end_wine_type_id,
+        "num_steps": num_steps,
+        "total_distance": round(total_dist, 4),
+        "dominant_transition_axis": biggest_change_param,
+        "trajectory": trajectory
+    }, indent=True)
+
+
+def _build_wine_tasting_presets_json() -> str:
+    """Serialize the preset overview returned by list_wine_tasting_rhythmic_presets"""
+    result = {}
+    for name, preset in WINE_RHYTHMIC_PRESETS.items():
+        result[name] = {
+            "period": preset["steps_per_cycle"],
+            "total_steps": preset["num_cycles"] * preset["steps_per_cycle"],
+            "pattern": preset["pattern"],
+            "state_a": preset["state_a"],
+            "state_b": preset["state_b"],
+            "description": preset["description"]
+        }
+    return _dumps(result, indent=True)
+
+
+_WINE_TASTING_PRESETS_JSON = _build_wine_tasting_presets_json()
+
+
+def list_wine_tasting_rhythmic_presets() -> str:
+    """
+    List all available wine tasting rhythmic presets.
+
+    Layer 2: Pure lookup (0 tokens)
+
+    Returns:
+        Preset names, periods, patterns, and descriptions.
+    """
+    return _WINE_TASTING_PRESETS_JSON
+
+
+def _build_applied_preset_json(preset_name: str) -> str:
+    """Serialize one preset's full oscillation for apply_wine_tasting_rhythmic_preset"""
+    preset = WINE_RHYTHMIC_PRESETS[preset_name]
+    sequence = _PRESET_SEQUENCES[preset_name]
+
+    return _dumps({
+        "preset_name": preset_name,
+        "period": preset["steps_per_cycle"],
+        "total_steps": len(sequence),
+        "pattern": preset["pattern"],
+        "state_a": preset["state_a"],
+        "state_b": preset["state_b"],
+        "description": preset["description"],
+        "sequence": sequence
+    }, indent=True)
+
+
+_APPLIED_PRESETS_JSON = {
+    preset_name: _build_applied_preset_json(preset_name)
+    for preset_name in WINE_RHYTHMIC_PRESETS
+}
+
+
+def apply_wine_tasting_rhythmic_preset(preset_name: str) -> str:
+    """
+    Apply curated wine tasting rhythmic pattern preset.
+
+    Layer 2: Deterministic sequence generation (0 tokens)
+
+    Available presets:
+        aging_evolution (24): young_burgundy ↔ aged_barolo
+        weight_spectrum (20): mosel_riesling ↔ napa_cabernet
+        terroir_pulse (18): young_burgundy ↔ rhone_syrah
+        elegance_richness (15): champagne_brut ↔ sauternes
+        structure_toggle (12): mosel_riesling ↔ aged_barolo
+
+    Args:
+        preset_name: One of the 5 rhythmic presets
+
+    Returns:
+        Complete oscillation sequence with parameter states at each step.
+    """
+    if preset_name not in WINE_RHYTHMIC_PRESETS:
+        return _dumps({"error": f"Unknown preset '{preset_name}'",
+                           "available": list(WINE_RHYTHMIC_PRESETS.keys())})
+
+    return _APPLIED_PRESETS_JSON[preset_name]
+
+
+def generate_wine_tasting_rhythmic_sequence(
+    state_a_id: str,
+    state_b_id: str,
+    oscillation_pattern: str = "sinusoidal",
+    num_cycles: int = 3,
+    steps_per_cycle: int = 20,
+    phase_offset: float = 0.0
+) -> str:
+    """
+    Generate rhythmic oscillation between two wine types.
+
+    Layer 2: Temporal composition (0 tokens)
+
+    Args:
+        state_a_id: Starting wine state
+        state_b_id: Alternating wine state
+        oscillation_pattern: "sinusoidal", "triangular", or "square"
+        num_cycles: Number of complete A→B→A cycles
+        steps_per_cycle: Samples per cycle
+        phase_offset: Starting phase (0.0 = A, 0.5 = B)
+
+    Returns:
+        Sequence with states, pattern info, and phase points.
+    """
+    if state_a_id not in WINE_TASTING_COORDS or state_b_id not in WINE_TASTING_COORDS:
+        return _dumps({"error": "Unknown wine state(s)",
+                           "available": list(WINE_TASTING_COORDS.keys())})
+
+    total_steps = num_cycles * steps_per_cycle
+    alphas = _generate_wine_oscillation(total_steps, num_cycles, oscillation_pattern)
+
+    # Apply phase offset
+    if phase_offset > 0:
+        offset_steps = int(phase_offset * steps_per_cycle)
+        alphas = np.concatenate((alphas[offset_steps:], alphas[:offset_steps]))
+
+    states = _interpolate_wine_sequence(state_a_id, state_b_id, alphas)
+
+    sequence = []
+    for i, (alpha, state) in enumerate(zip(alphas.tolist(), states.tolist())):
+        sequence.append({
+            "step": i,
+            "phase": round(i / total_steps, 4),
+            "blend_factor": round(alpha, 4),
+            "state": _state_to_dict(state)
+        })
+
+    return _dumps({
+        "state_a": state_a_id,
+        "state_b": state_b_id,
+        "oscillation_pattern": oscillation_pattern,
+        "num_cycles": num_cycles,
+        "steps_per_cycle": steps_per_cycle,
+        "total_steps": total_steps,
+        "phase_offset": phase_offset,
+        "sequence": sequence
+    }, indent=True)
+
+
+# ============================================================================
+# PHASE 2.7 - ATTRACTOR VISUALIZATION PROMPT GENERATION
+# ============================================================================
+
+def _rounded_state(coords: dict) -> dict:
+    """Echo a state rounded to 4 places, defaulting missing parameters to 0.0."""
+    return {p: round(coords.get(p, 0.0), 4) for p in WINE_PARAMETER_NAMES}
+
+
+# Canonical types resolve to the same nearest match and echo the same rounded
+# coordinates on every call
+_NEAREST_BY_TYPE = {
+    type_id: _find_nearest_wine_visual_type(type_data["coords"])
+    for type_id, type_data in WINE_VISUAL_TYPES.items()
+}
+_ROUNDED_STATE_BY_TYPE = {
+    type_id: _rounded_state(type_data["coords"])
+    for type_id, type_data in WINE_VISUAL_TYPES.items()
+}
+
+
+def _weighted_keywords(keywords: list, strength: float) -> list:
+    """Attach a descending weight (5% per rank) scaled by strength to each keyword."""
+    return [
+        {"keyword": kw, "weight": round(strength * (1.0 - 0.05 * i), 2)}
+        for i, kw in enumerate(keywords)
+    ]
+
+
+# Full-strength weights are the default, so keep them ready per visual type
+_UNIT_WEIGHTED_KEYWORDS = {
+    type_id: _weighted_keywords(type_data["keywords"], 1.0)
+    for type_id, type_data in WINE_VISUAL_TYPES.items()
+}
+
+
+def extract_wine_tasting_visual_vocabulary(
+    state: Optional[Dict[str, float]] = None,
+    wine_type_id: Optional[str] = None,
+    strength: float = 1.0
+) -> str:
+    """
+    Extract visual vocabulary from wine parameter coordinates.
+
+    Layer 2: Deterministic vocabulary mapping (0 tokens)
+
+    Maps a 5D parameter state to the nearest visual type and returns
+    image-generation-ready keywords.
+
+    Args:
+        state: Parameter coordinates dict (structural_tension, color_depth, etc.)
+            Provide either state or wine_type_id.
+        wine_type_id: Canonical wine type to use as state source.
+        strength: Keyword weight multiplier [0.0, 1.0] (default: 1.0)
+
+    Returns:
+        Nearest visual type, keywords, optical properties, and vocabulary.
+    """
+    if wine_type_id and wine_type_id in WINE_VISUAL_TYPES:
+        nearest_type, distance = _NEAREST_BY_TYPE[wine_type_id]
+        input_state = _ROUNDED_STATE_BY_TYPE[wine_type_id]
+    elif state:
+        nearest_type, distance = _find_nearest_wine_visual_type(state)
+        input_state = _rounded_state(state)
+    else:
+        return _dumps({"error": "Provide either state or wine_type_id"})
+    type_data = WINE_VISUAL_TYPES[nearest_type]
+
+    if strength == 1.0:
+        weighted_keywords = _UNIT_WEIGHTED_KEYWORDS[nearest_type]
+    else:
+        weighted_keywords = _weighted_keywords(type_data["keywords"], strength)
+
+    return _dumps({
+        "nearest_type": nearest_type,
+        "distance": round(distance, 4),
+        "keywords": type_data["keywords"],
+        "weighted_keywords": weighted_keywords,
+        "optical_properties": type_data["optical_properties"],
+        "input_state": input_state
+    }, indent=True)
+
+
+# Prompt bodies are constant per visual type: keywords plus optical descriptors
+# (finish and refraction for composite prompts, finish only for keyframes)
+_COMPOSITE_PROMPTS = {
+    type_id: ", ".join([
+        *type_data["keywords"],
+        f"{type_data['optical_properties']['finish']} finish",
+        type_data["optical_properties"]["refraction"]
+    ])
+    for type_id, type_data in WINE_VISUAL_TYPES.items()
+}
+_KEYFRAME_PROMPTS = {
+    type_id: ", ".join([*type_data["keywords"], f"{type_data['optical_properties']['finish']} finish"])
+    for type_id, type_data in WINE_VISUAL_TYPES.items()
+}
+
+
+def _with_style(style_modifier: str, prompt: str) -> str:
+    """Prefix a prompt with the optional style modifier."""
+    return f"{style_modifier}, {prompt}" if style_modifier else prompt
+
+
+# Marker substrings that sort a visual type's keywords into split-view categories
+_SPLIT_VIEW_MARKERS = {
+    "color_light": ("color", "ruby", "gold", "amber", "pale",
+                    "deep", "opaque", "transluc", "crystal",
+                    "inky", "garnet", "brick", "purple", "straw"),
+    "texture_structure": ("texture", "silk", "chalk", "velvet", "dense",
+                          "grip", "taut", "weight", "mousse", "viscous",
+                          "crisp", "unctuous", "fine"),
+    "aroma_complexity": ("aroma", "fruit", "herb", "spice", "pepper",
+                         "smoke", "truffle", "honey", "toast", "leather",
+                         "cherry", "citrus", "rose", "tar", "ginger",
+                         "apricot", "biscuit"),
+    "atmosphere_mood": ("noble", "primal", "elegant", "power", "wild",
+                        "intimate", "celebrat", "austere", "lush",
+                        "luminous", "precise", "dynamic", "volcanic",
+                        "restrain", "sophisticat")
+}
+
+
+def _split_view_categories(keywords: list) -> dict:
+    """Group keywords by split-view category; unmatched ones go under "general"."""
+    categories = {
+        cat_name: [kw for kw in keywords if any(w in kw.lower() for w in markers)]
+        for cat_name, markers in _SPLIT_VIEW_MARKERS.items()
+    }
+    # Catch any keywords not classified
+    classified = set()
+    for cat_kws in categories.values():
+        classified.update(cat_kws)
+    uncategorized = [kw for kw in keywords if kw not in classified]
+    if uncategorized:
+        categories["general"] = uncategorized
+    return categories
+
+
+# The keyword catalog is constant, so classify each visual type once
+_SPLIT_VIEW_CATEGORIES = {
+    type_id: _split_view_categories(type_data["keywords"])
+    for type_id, type_data in WINE_VISUAL_TYPES.items()
+}
+
+
+def _render_wine_tasting_prompt(
+    nearest_type: str,
+    distance: float,
+    source_state: dict,
+    mode: str,
+    style_modifier: str
+) -> str:
+    """Serialize the prompt response for a resolved nearest visual type."""
+    type_data = WINE_VISUAL_TYPES[nearest_type]
+
+    if mode == "composite":
+        opt = type_data["optical_properties"]
+        prompt = _with_style(style_modifier, _COMPOSITE_PROMPTS[nearest_type])
+
+        return _dumps({
+            "mode": "composite",
+            "prompt": prompt,
+            "nearest_type": nearest_type,
+            "distance": round(distance, 4),
+            "optical_properties": opt,
+            "source_state": source_state
+        }, indent=True)
+
+    elif mode == "split_view":
+        categories = _SPLIT_VIEW_CATEGORIES[nearest_type]
+
+        split_prompts = {}
+        for cat_name, cat_kws in categories.items():
+            if cat_kws:
+                parts = []
+                if style_modifier:
+                    parts.append(style_modifier)
+                parts.extend(cat_kws)
+                split_prompts[cat_name] = ", ".join(parts)
+
+        return _dumps({
+            "mode": "split_view",
+            "prompts": split_prompts,
+            "nearest_type": nearest_type,
+            "distance": round(distance, 4),
+            "source_state": source_state
+        }, indent=True)
+
+    return _dumps({"error": f"Unknown mode '{mode}'. Use 'composite' or 'split_view'."})
+
+
+@lru_cache(maxsize=512)
+def _canonical_wine_tasting_prompt(wine_type_id: str, mode: str, style_modifier: str) -> str:
+    """Prompt response for a canonical type; the serialized string is safe to share."""
+    nearest_type, distance = _NEAREST_BY_TYPE[wine_type_id]
+    return _render_wine_tasting_prompt(
+        nearest_type, distance, _ROUNDED_STATE_BY_TYPE[wine_type_id], mode, style_modifier
+    )
+
+
+def generate_wine_tasting_prompt(
+    wine_type_id: str = "",
+    custom_state: Optional[Dict[str, float]] = None,
+    mode: str = "composite",
+    style_modifier: str = ""
+) -> str:
+    """
+    Generate image generation prompt from wine state or canonical type.
+
+    Layer 2: Deterministic prompt synthesis (0 tokens)
+
+    Translates wine tasting coordinates into visual prompts suitable
+    for ComfyUI, Stable Diffusion, DALL-E, etc.
+
+    Args:
+        wine_type_id: Canonical wine type (or "" with custom_state)
+        custom_state: Optional custom 5D coordinates
+        mode: "composite" (single blended prompt) or "split_view" (per-category)
+        style_modifier: Optional prefix ("photorealistic", "oil painting", etc.)
+
+    Returns:
+        Prompt string(s) with vocabulary details and wine metadata.
+    """
+    # Resolve coordinates; canonical types are pure lookups, so memoize them
+    if custom_state:
+        nearest_type, distance = _find_nearest_wine_visual_type(custom_state)
+        return _render_wine_tasting_prompt(
+            nearest_type, distance, _rounded_state(custom_state), mode, style_modifier
+        )
+    elif wine_type_id and wine_type_id in WINE_VISUAL_TYPES:
+        return _canonical_wine_tasting_prompt(wine_type_id, mode, style_modifier)
+    else:
+        return _dumps({"error": "Provide wine_type_id or custom_state",
+                           "available": _VISUAL_TYPE_IDS})
+
+
+@lru_cache(maxsize=128)
+def _keyframe_indices(total: int, keyframe_count: int) -> tuple:
+    """Evenly spaced step indices for keyframe_count frames out of total steps."""
+    if keyframe_count >= total:
+        return tuple(range(total))
+    return tuple(int(i * total / keyframe_count) for i in range(keyframe_count))
+
+
+def generate_wine_tasting_sequence_prompts(
+    preset_name: str,
+    keyframe_count: int = 4,
+    style_modifier: str = ""
+) -> str:
+    """
+    Generate keyframe prompts from a rhythmic preset.
+
+    Layer 2: Deterministic keyframe extraction (0 tokens)
+
+    Extracts evenly-spaced keyframes from a rhythmic oscillation
+    and generates an image prompt for each. Useful for storyboards,
+    animation keyframes, and multi-panel visualizations.
+
+    Args:
+        preset_name: One of the 5 rhythmic presets
+        keyframe_count: Number of keyframes to extract (default: 4)
+        style_modifier: Optional style prefix for all prompts
+
+    Returns:
+        Keyframes with step index, state, prompt, and vocabulary.
+    """
+    if preset_name not in WINE_RHYTHMIC_PRESETS:
+        return _dumps({"error": f"Unknown preset '{preset_name}'",
+                           "available": list(WINE_RHYTHMIC_PRESETS.keys())})
+
+    sequence = _PRESET_SEQUENCES[preset_name]
+    total = len(sequence)
+
+    # Extract evenly-spaced keyframes
+    indices = _keyframe_indices(total, keyframe_count)
+
+    # Resolve every keyframe's nearest visual type in one batched kernel call
+    nearest_idx, nearest_dist = _nearest_rows(
+        _PRESET_STATE_MATRICES[preset_name][list(indices)],
+        _VISUAL_TYPE_COORDS
+    )
+
+    keyframes = []
+    for k, idx in enumerate(indices):
+        step_data = sequence[idx]
+        state = step_data["state"]
+        nearest_type, dist = _VISUAL_TYPE_IDS[nearest_idx[k]], float(nearest_dist[k])
+        prompt = _with_style(style_modifier, _KEYFRAME_PROMPTS[nearest_type])
+
+        keyframes.append({
+            "step": step_data["step"],
+            "phase": step_data["phase"],
+            "blend_factor": step_data["blend_factor"],
+            "state": state,
+            "nearest_visual_type": nearest_type,
+            "distance": round(dist, 4),
+            "prompt": prompt
+        })
+
+    return _dumps({
+        "preset": preset_name,
+        "period": WINE_RHYTHMIC_PRESETS[preset_name]["steps_per_cycle"],
+        "keyframe_count": len(keyframes),
+        "keyframes": keyframes
+    }, indent=True)
+
+
+def _build_wine_tasting_server_info_json() -> str:
+    """Serialize the server metadata returned by get_wine_tasting_server_info"""
+    return _dumps({
+        "server": "Wine Tasting Visual Vocabulary",
+        "version": "2.6.0",
+        "description": "Oenological expertise translated into visual parameters for image generation",
+        "methodology": "Court of Master Sommeliers + WSET frameworks",
+        "capabilities": {
+            "layer_1_taxonomy": {
+                "wine_types": len(WINE_VISUAL_TYPES),
+                "varietal_count": len(Varietal),
+                "aroma_clusters": len(AROMA_CLUSTERS),
+                "tools": [
+                    "get_wine_tasting_types",
+                    "get_wine_tasting_specifications",
+                    "get_varietal_list",
+                    "get_aroma_clusters"
+                ]
+            },
+            "layer_2_computation": {
+                "parameter_dimensions": len(WINE_PARAMETER_NAMES),
+                "parameter_names": WINE_PARAMETER_NAMES,
+                "canonical_states": len(WINE_TASTING_COORDS),
+                "tools": [
+                    "map_wine_tasting_parameters",
+                    "compute_wine_tasting_distance",
+                    "compute_wine_tasting_trajectory",
+                    "generate_wine_tasting_rhythmic_sequence",
+                    "extract_wine_tasting_visual_vocabulary",
+                    "generate_wine_tasting_prompt",
+                    "generate_wine_tasting_sequence_prompts"
+                ]
+            },
+            "layer_3_synthesis": {
+                "tools": [
+                    "generate_wine_visual_vocabulary",
+                    "evolution_sequence",
+                    "compare_wine_profiles",
+                    "create_regional_preset"
+                ]
+            },
+            "strategy_analysis": {
+                "tools": ["analyze_strategy_document_tool"],
+                "methodology": "deterministic_pattern_matching",
+                "llm_cost": 0
+            }
+        },
+        "phase_2_6_enhancements": {
+            "rhythmic_presets": True,
+            "preset_count": len(WINE_RHYTHMIC_PRESETS),
+            "presets": {
+                name: {
+                    "period": p["steps_per_cycle"],
+                    "pattern": p["pattern"],
+                    "states": f"{p['state_a']} ↔ {p['state_b']}"
+                }
+                for name, p in WINE_RHYTHMIC_PRESETS.items()
+            },
+            "periods": sorted(set(p["steps_per_cycle"] for p in WINE_RHYTHMIC_PRESETS.values()))
+        },
+        "phase_2_7_enhancements": {
+            "attractor_visualization": True,
+            "visual_type_count": len(WINE_VISUAL_TYPES),
+            "visual_types": _VISUAL_TYPE_IDS,
+            "prompt_modes": ["composite", "split_view"],
+            "keyframe_generation": True
+        },
+        "domain_integration": {
+            "domain_id": "wine_tasting",
+            "parameter_names": WINE_PARAMETER_NAMES,
+            "preset_periods": sorted(set(p["steps_per_cycle"] for p in WINE_RHYTHMIC_PRESETS.values())),
+            "canonical_state_ids": list(WINE_TASTING_COORDS.keys()),
+            "compatible_with": "aesthetic-dynamics-core, composition-graph-mcp"
+        }
+    }, indent=True)
+
+
+# Every field is derived from module constants, so the payload never changes
+_WINE_TASTING_SERVER_INFO_JSON = _build_wine_tasting_server_info_json()
+
+
+def get_wine_tasting_server_info() -> str:
+    """
+    Get information about the Wine Tasting Visual Vocabulary MCP server.
+
+    Returns server metadata, capabilities, and phase status.
+    """
+    return _WINE_TASTING_SERVER_INFO_JSON
+
+
+# ============================================================================
+# STRATEGY ANALYSIS (Tomographic Domain Projection) - original tools below
+# ============================================================================
+
+def analyze_strategy_document_tool(strategy_text: str) -> str:
+    """
+    Analyze a strategy document through wine tasting compositional principles.
+
+    This is the tomographic domain projection tool - it projects strategic
+    text through wine tasting vocabulary to detect structural patterns.
+
+    Zero LLM cost - pure deterministic pattern matching.
+
+    Args:
+        strategy_text: Full text of the strategy document to analyze
+
+    Returns:
+        JSON string with domain projection results including:
+        - domain: "wine_tasting"
+        - findings: List of detected patterns with dimensions, confidence, evidence
+        - total_findings: Count of findings
+        - methodology: "deterministic_pattern_matching"
+        - llm_cost_tokens: 0
+
+    Example:
+        result = analyze_strategy_document_tool(strategy_pdf_text)
+        Returns findings like:
+        {
+          "domain": "wine_tasting",
+          "findings": [
+            {
+              "dimension": "balance_integration",
+              "pattern": "acidic_harsh",
+              "confidence": 0.75,
+              "evidence": ["conflict", "tension", "harsh"],
+              "categorical_family": "constraints"
+            }
+          ],
+          "total_findings": 4,
+          "llm_cost_tokens": 0
+        }
+    """
+    result = analyze_strategy_document(strategy_text)
+    return _dumps(result, indent=True)
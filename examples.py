@@ -4,170 +4,202 @@ Example usage of Wine Tasting Visual Vocabulary MCP Server
 This script demonstrates all the tools and common workflows.
 """
 
-import server
 import json
+import logging
+import logging.handlers
+import sys
 
-# Helper to call wrapped MCP functions
-def call_tool(tool_name, *args, **kwargs):
-    """Helper to call FastMCP-wrapped tools"""
-    tool = getattr(server, tool_name)
-    return tool.fn(*args, **kwargs)
+# core builds its lookup tables at import, so each example imports the tool it
+# needs on first use; importing this module alone stays cheap.
 
-# Create convenience wrappers
-generate_wine_visual_vocabulary = lambda *args, **kwargs: call_tool('generate_wine_visual_vocabulary', *args, **kwargs)
-compare_wine_profiles = lambda *args, **kwargs: call_tool('compare_wine_profiles', *args, **kwargs)
-get_varietal_list = lambda *args, **kwargs: call_tool('get_varietal_list', *args, **kwargs)
-get_aroma_clusters = lambda *args, **kwargs: call_tool('get_aroma_clusters', *args, **kwargs)
-create_regional_preset = lambda *args, **kwargs: call_tool('create_regional_preset', *args, **kwargs)
-evolution_sequence = lambda *args, **kwargs: call_tool('evolution_sequence', *args, **kwargs)
+FEATURED_REGIONS = ["burgundy_red", "napa_cabernet", "barolo", "mosel_riesling"]
+FEATURED_CLUSTERS = ["red_fruit", "black_fruit", "earth_mineral", "oak_spice"]
+RED_VARIETALS = ["pinot_noir", "cabernet_sauvignon", "merlot", "syrah", "nebbiolo", "tempranillo"]
+WHITE_VARIETALS = ["chardonnay", "sauvignon_blanc", "riesling", "viognier", "pinot_grigio"]
 
+# Examples report through a logger; the __main__ block attaches a buffered
+# stdout handler, so importing this module as a library stays quiet.
+log = logging.getLogger("examples")
 
-def print_section(title):
-    """Print formatted section header"""
-    print("\n" + "="*80)
-    print(f"  {title}")
-    print("="*80 + "\n")
+# Display strings for raw snake_case keys, formatted once at import
+_DISPLAY_NAME = {name: name.replace('_', ' ').title() for name in RED_VARIETALS + WHITE_VARIETALS}
+_HEADING = {name: name.upper().replace('_', ' ') for name in FEATURED_REGIONS + FEATURED_CLUSTERS}
+
+
+def section_header(title):
+    """Format section header"""
+    return "\n" + "="*80 + f"\n  {title}\n" + "="*80 + "\n"
+
+
+# Vocabulary scenarios: (title, input summary lines, tool kwargs, (label, section, field) rows)
+SCENARIOS = {
+    "burgundy_pinot": (
+        "Example 1: Classic Burgundy Pinot Noir",
+        [
+            "INPUT: Mature Burgundy Pinot Noir",
+            "  - Cool climate, Old World, French oak",
+            "  - High acidity (7.5), Moderate tannin (6.0)",
+            "  - Cherry, mushroom, rose aromatics",
+        ],
+        {
+            "varietal": "pinot_noir",
+            "climate": "cool",
+            "winemaking_style": "old_world",
+            "oak_treatment": "french_oak",
+            "age": "developing",
+            "acidity": 7.5,
+            "tannin": 6.0,
+            "sweetness": 2.0,
+            "alcohol": 6.5,
+            "body": 5.5,
+            "finish_length": "long",
+            "primary_aromas": ["cherry", "mushroom", "rose"]
+        },
+        [
+            ("Color", "base_color", "description"),
+            ("Age modification", "base_color", "age_modified"),
+            ("Opacity", "opacity_clarity", "base_opacity"),
+            ("Texture", "texture_surface", "base_texture"),
+            ("Structure", "texture_surface", "structure"),
+            ("Composition", "compositional_structure", "base_composition"),
+            ("Visual tension", "balance_relationships", "visual_tension"),
+            ("Visual weight", "balance_relationships", "visual_weight"),
+            ("Atmosphere", "atmospheric_qualities", "style_atmosphere"),
+        ]
+    ),
+    "napa_cabernet": (
+        "Example 2: Bold Napa Valley Cabernet Sauvignon",
+        [
+            "INPUT: Young Napa Cabernet Sauvignon",
+            "  - Warm climate, New World, American oak",
+            "  - High tannin (8.5), High alcohol (8.5), Full body (9.0)",
+            "  - Blackcurrant, vanilla, cedar aromatics",
+        ],
+        {
+            "varietal": "cabernet_sauvignon",
+            "climate": "warm",
+            "winemaking_style": "new_world",
+            "oak_treatment": "american_oak",
+            "age": "youthful",
+            "acidity": 5.5,
+            "tannin": 8.5,
+            "sweetness": 2.5,
+            "alcohol": 8.5,
+            "body": 9.0,
+            "finish_length": "very_long",
+            "primary_aromas": ["blackcurrant", "vanilla", "cedar"]
+        },
+        [
+            ("Color", "base_color", "description"),
+            ("Opacity", "opacity_clarity", "base_opacity"),
+            ("Texture", "texture_surface", "base_texture"),
+            ("Structure", "texture_surface", "structure"),
+            ("Visual weight", "balance_relationships", "visual_weight"),
+            ("Oak influence", "texture_surface", "oak_overlay"),
+            ("Finish", "finish_dimension", "descriptor"),
+        ]
+    ),
+    "mosel_riesling": (
+        "Example 3: Mosel Riesling - Crystalline Precision",
+        [
+            "INPUT: Young Mosel Riesling",
+            "  - Cool climate, No oak, High acidity (9.0)",
+            "  - Light body (4.0), Low alcohol (4.5)",
+            "  - Lime, slate, petrol aromatics",
+        ],
+        {
+            "varietal": "riesling",
+            "climate": "cool",
+            "winemaking_style": "old_world",
+            "oak_treatment": "none",
+            "age": "youthful",
+            "acidity": 9.0,
+            "tannin": 0.0,
+            "sweetness": 4.0,
+            "alcohol": 4.5,
+            "body": 4.0,
+            "finish_length": "long",
+            "primary_aromas": ["lime", "slate", "petrol"]
+        },
+        [
+            ("Color", "base_color", "description"),
+            ("Texture", "texture_surface", "base_texture"),
+            ("Structure", "texture_surface", "structure"),
+            ("Visual tension", "balance_relationships", "visual_tension"),
+            ("Climate modifier", "texture_surface", "climate_modifier"),
+            ("Composition", "compositional_structure", "base_composition"),
+        ]
+    ),
+}
+
+
+def run_scenario(name):
+    """Generate a scenario's vocabulary and format its report lines"""
+    from core import generate_wine_visual_vocabulary
+    title, summary, params, fields = SCENARIOS[name]
+    result = generate_wine_visual_vocabulary(**params)
+    
+    lines = [section_header(title), *summary, "", "VISUAL VOCABULARY OUTPUT:"]
+    for label, section, field in fields:
+        lines.append(f"  {label}: {result[section][field]}")
+    return lines, result
 
 
 def example_1_basic_burgundy_pinot():
     """Generate visual vocabulary for classic Burgundy Pinot Noir"""
-    print_section("Example 1: Classic Burgundy Pinot Noir")
-    
-    result = generate_wine_visual_vocabulary(
-        varietal="pinot_noir",
-        climate="cool",
-        winemaking_style="old_world",
-        oak_treatment="french_oak",
-        age="developing",
-        acidity=7.5,
-        tannin=6.0,
-        sweetness=2.0,
-        alcohol=6.5,
-        body=5.5,
-        finish_length="long",
-        primary_aromas=["cherry", "mushroom", "rose"]
-    )
-    
-    print("INPUT: Mature Burgundy Pinot Noir")
-    print("  - Cool climate, Old World, French oak")
-    print("  - High acidity (7.5), Moderate tannin (6.0)")
-    print("  - Cherry, mushroom, rose aromatics")
-    print()
-    
-    print("VISUAL VOCABULARY OUTPUT:")
-    print(f"  Color: {result['base_color']['description']}")
-    print(f"  Age modification: {result['base_color']['age_modified']}")
-    print(f"  Opacity: {result['opacity_clarity']['base_opacity']}")
-    print(f"  Texture: {result['texture_surface']['base_texture']}")
-    print(f"  Structure: {result['texture_surface']['structure']}")
-    print(f"  Composition: {result['compositional_structure']['base_composition']}")
-    print(f"  Visual tension: {result['balance_relationships']['visual_tension']}")
-    print(f"  Visual weight: {result['balance_relationships']['visual_weight']}")
-    print(f"  Atmosphere: {result['atmospheric_qualities']['style_atmosphere']}")
-    print()
-    
-    print("IMAGE GENERATION PROMPT:")
-    print(f"  Create an image with {result['base_color']['description']} color,")
-    print(f"  {result['texture_surface']['base_texture']} texture,")
-    print(f"  {result['compositional_structure']['base_composition']} composition,")
-    print(f"  {result['atmospheric_qualities']['climate_atmosphere']} atmosphere,")
-    print(f"  with {result['compositional_structure']['edge_quality']} edges")
+    lines, result = run_scenario("burgundy_pinot")
+    bc = result['base_color']
+    ts = result['texture_surface']
+    cs = result['compositional_structure']
+    aq = result['atmospheric_qualities']
+    
+    lines.append("")
+    lines.append("IMAGE GENERATION PROMPT:")
+    lines.append(f"  Create an image with {bc['description']} color,")
+    lines.append(f"  {ts['base_texture']} texture,")
+    lines.append(f"  {cs['base_composition']} composition,")
+    lines.append(f"  {aq['climate_atmosphere']} atmosphere,")
+    lines.append(f"  with {cs['edge_quality']} edges")
+    
+    log.info("\n".join(lines))
 
 
 def example_2_bold_napa_cabernet():
     """Generate visual vocabulary for bold Napa Cabernet"""
-    print_section("Example 2: Bold Napa Valley Cabernet Sauvignon")
-    
-    result = generate_wine_visual_vocabulary(
-        varietal="cabernet_sauvignon",
-        climate="warm",
-        winemaking_style="new_world",
-        oak_treatment="american_oak",
-        age="youthful",
-        acidity=5.5,
-        tannin=8.5,
-        sweetness=2.5,
-        alcohol=8.5,
-        body=9.0,
-        finish_length="very_long",
-        primary_aromas=["blackcurrant", "vanilla", "cedar"]
-    )
-    
-    print("INPUT: Young Napa Cabernet Sauvignon")
-    print("  - Warm climate, New World, American oak")
-    print("  - High tannin (8.5), High alcohol (8.5), Full body (9.0)")
-    print("  - Blackcurrant, vanilla, cedar aromatics")
-    print()
-    
-    print("VISUAL VOCABULARY OUTPUT:")
-    print(f"  Color: {result['base_color']['description']}")
-    print(f"  Opacity: {result['opacity_clarity']['base_opacity']}")
-    print(f"  Texture: {result['texture_surface']['base_texture']}")
-    print(f"  Structure: {result['texture_surface']['structure']}")
-    print(f"  Visual weight: {result['balance_relationships']['visual_weight']}")
-    print(f"  Oak influence: {result['texture_surface']['oak_overlay']}")
-    print(f"  Finish: {result['finish_dimension']['descriptor']}")
+    lines, _ = run_scenario("napa_cabernet")
+    log.info("\n".join(lines))
 
 
 def example_3_crisp_mosel_riesling():
     """Generate visual vocabulary for crystalline Mosel Riesling"""
-    print_section("Example 3: Mosel Riesling - Crystalline Precision")
-    
-    result = generate_wine_visual_vocabulary(
-        varietal="riesling",
-        climate="cool",
-        winemaking_style="old_world",
-        oak_treatment="none",
-        age="youthful",
-        acidity=9.0,
-        tannin=0.0,
-        sweetness=4.0,
-        alcohol=4.5,
-        body=4.0,
-        finish_length="long",
-        primary_aromas=["lime", "slate", "petrol"]
-    )
-    
-    print("INPUT: Young Mosel Riesling")
-    print("  - Cool climate, No oak, High acidity (9.0)")
-    print("  - Light body (4.0), Low alcohol (4.5)")
-    print("  - Lime, slate, petrol aromatics")
-    print()
-    
-    print("VISUAL VOCABULARY OUTPUT:")
-    print(f"  Color: {result['base_color']['description']}")
-    print(f"  Texture: {result['texture_surface']['base_texture']}")
-    print(f"  Structure: {result['texture_surface']['structure']}")
-    print(f"  Visual tension: {result['balance_relationships']['visual_tension']}")
-    print(f"  Climate modifier: {result['texture_surface']['climate_modifier']}")
-    print(f"  Composition: {result['compositional_structure']['base_composition']}")
+    lines, _ = run_scenario("mosel_riesling")
+    log.info("\n".join(lines))
 
 
 def example_4_regional_presets():
     """Demonstrate regional preset usage"""
-    print_section("Example 4: Regional Presets")
-    
-    regions = [
-        "burgundy_red",
-        "napa_cabernet", 
-        "barolo",
-        "mosel_riesling"
-    ]
+    from core import create_regional_preset
+    lines = [section_header("Example 4: Regional Presets")]
     
-    for region in regions:
+    for region in FEATURED_REGIONS:
         result = create_regional_preset(region)
+        meta = result['metadata']
+        cs = result['compositional_structure']
         
-        print(f"{region.upper().replace('_', ' ')}:")
-        print(f"  Varietal: {result['metadata']['varietal']}")
-        print(f"  Climate: {result['metadata']['climate']}")
-        print(f"  Style: {result['metadata']['winemaking_style']}")
-        print(f"  Visual signature: {result['compositional_structure']['base_composition']}")
-        print()
+        lines.append(f"{_HEADING[region]}:")
+        lines.append(f"  Varietal: {meta['varietal']}")
+        lines.append(f"  Climate: {meta['climate']}")
+        lines.append(f"  Style: {meta['winemaking_style']}")
+        lines.append(f"  Visual signature: {cs['base_composition']}")
+        lines.append("")
+    
+    log.info("\n".join(lines))
 
 
 def example_5_evolution_sequence():
     """Show wine evolution over time"""
-    print_section("Example 5: Wine Evolution - Pinot Noir Through Time")
+    from core import evolution_sequence
+    lines = [section_header("Example 5: Wine Evolution - Pinot Noir Through Time")]
     
     result = evolution_sequence(
         varietal="pinot_noir",
@@ -184,24 +216,33 @@ def example_5_evolution_sequence():
     
     for age in ages:
         wine = result["evolution_sequence"][age]
+        bc = wine['base_color']
+        oc = wine['opacity_clarity']
+        ts = wine['texture_surface']
+        cs = wine['compositional_structure']
+        ad = wine['aromatic_descriptors']
+        aq = wine['atmospheric_qualities']
         
-        print(f"{age.upper()}:")
-        print(f"  Color: {wine['base_color']['age_modified']}")
-        print(f"  Clarity: {wine['opacity_clarity']['clarity']}")
-        print(f"  Texture state: {wine['texture_surface']['age_state']}")
-        print(f"  Integration: {wine['compositional_structure']['integration']}")
-        print(f"  Aromatics: {wine['aromatic_descriptors']['aroma_category']}")
-        print(f"  Time signature: {wine['atmospheric_qualities']['time_signature']}")
-        print()
-    
-    print("KEY TRANSFORMATIONS:")
+        lines.append(f"{age.upper()}:")
+        lines.append(f"  Color: {bc['age_modified']}")
+        lines.append(f"  Clarity: {oc['clarity']}")
+        lines.append(f"  Texture state: {ts['age_state']}")
+        lines.append(f"  Integration: {cs['integration']}")
+        lines.append(f"  Aromatics: {ad['aroma_category']}")
+        lines.append(f"  Time signature: {aq['time_signature']}")
+        lines.append("")
+    
+    lines.append("KEY TRANSFORMATIONS:")
     for key, value in result["key_transformations"].items():
-        print(f"  {key}: {value}")
+        lines.append(f"  {key}: {value}")
+    
+    log.info("\n".join(lines))
 
 
 def example_6_comparison():
     """Compare two different wines"""
-    print_section("Example 6: Comparing Pinot Noir vs Cabernet Sauvignon")
+    from core import compare_wine_profiles
+    lines = [section_header("Example 6: Comparing Pinot Noir vs Cabernet Sauvignon")]
     
     result = compare_wine_profiles(
         wine1_params={
@@ -223,80 +264,83 @@ def example_6_comparison():
             "acidity": 5.5
         }
     )
-    
-    print("BURGUNDY PINOT NOIR vs NAPA CABERNET:")
-    print()
-    
-    print("COLOR CONTRAST:")
-    print(f"  Pinot: {result['color_contrast']['wine1']['description']}")
-    print(f"  Cabernet: {result['color_contrast']['wine2']['description']}")
-    print(f"  Difference: {result['color_contrast']['difference']}")
-    print()
-    
-    print("TEXTURE CONTRAST:")
-    print(f"  Pinot: {result['texture_contrast']['wine1']}")
-    print(f"  Cabernet: {result['texture_contrast']['wine2']}")
-    print()
-    
-    print("WEIGHT CONTRAST:")
-    print(f"  Pinot: {result['weight_contrast']['wine1']}")
-    print(f"  Cabernet: {result['weight_contrast']['wine2']}")
-    print()
-    
-    print("BALANCE COMPARISON:")
-    print(f"  Pinot tension: {result['balance_comparison']['wine1_tension']}")
-    print(f"  Cabernet tension: {result['balance_comparison']['wine2_tension']}")
+    color = result['color_contrast']
+    texture = result['texture_contrast']
+    weight = result['weight_contrast']
+    balance = result['balance_comparison']
+    
+    lines.append("BURGUNDY PINOT NOIR vs NAPA CABERNET:")
+    lines.append("")
+    
+    lines.append("COLOR CONTRAST:")
+    lines.append(f"  Pinot: {color['wine1']['description']}")
+    lines.append(f"  Cabernet: {color['wine2']['description']}")
+    lines.append(f"  Difference: {color['difference']}")
+    lines.append("")
+    
+    lines.append("TEXTURE CONTRAST:")
+    lines.append(f"  Pinot: {texture['wine1']}")
+    lines.append(f"  Cabernet: {texture['wine2']}")
+    lines.append("")
+    
+    lines.append("WEIGHT CONTRAST:")
+    lines.append(f"  Pinot: {weight['wine1']}")
+    lines.append(f"  Cabernet: {weight['wine2']}")
+    lines.append("")
+    
+    lines.append("BALANCE COMPARISON:")
+    lines.append(f"  Pinot tension: {balance['wine1_tension']}")
+    lines.append(f"  Cabernet tension: {balance['wine2_tension']}")
+    
+    log.info("\n".join(lines))
 
 
 def example_7_aroma_exploration():
     """Explore aroma clusters and their visual mappings"""
-    print_section("Example 7: Aroma Cluster Visual Mappings")
+    from core import get_aroma_clusters
+    lines = [section_header("Example 7: Aroma Cluster Visual Mappings")]
     
     clusters = get_aroma_clusters()
     
-    featured_clusters = ["red_fruit", "black_fruit", "earth_mineral", "oak_spice"]
-    
-    for cluster_name in featured_clusters:
+    for cluster_name in FEATURED_CLUSTERS:
         cluster = clusters[cluster_name]
         
-        print(f"{cluster_name.upper().replace('_', ' ')}:")
-        print(f"  Notes: {', '.join(cluster['notes'][:5])}")
-        print(f"  Brightness: {cluster['brightness']}")
-        print(f"  Texture: {cluster['texture']}")
-        print(f"  Color palette: {cluster['color_palette'][:3]}")
-        print()
+        lines.append(f"{_HEADING[cluster_name]}:")
+        lines.append(f"  Notes: {', '.join(cluster['notes'][:5])}")
+        lines.append(f"  Brightness: {cluster['brightness']}")
+        lines.append(f"  Texture: {cluster['texture']}")
+        lines.append(f"  Color palette: {list(cluster['color_palette'][:3])}")
+        lines.append("")
+    
+    log.info("\n".join(lines))
 
 
 def example_8_varietal_reference():
     """Show all available varietals"""
-    print_section("Example 8: Available Varietals Reference")
+    from core import get_varietal_list
+    lines = [section_header("Example 8: Available Varietals Reference")]
     
     varietals = get_varietal_list()
     
-    print("RED VARIETALS:")
-    reds = [
-        "pinot_noir", "cabernet_sauvignon", "merlot", 
-        "syrah", "nebbiolo", "tempranillo"
-    ]
-    for varietal in reds:
+    lines.append("RED VARIETALS:")
+    for varietal in RED_VARIETALS:
         if varietal in varietals:
             v = varietals[varietal]
-            print(f"  {varietal.replace('_', ' ').title()}: {v['texture']}, {v['structure']}")
-    
-    print("\nWHITE VARIETALS:")
-    whites = [
-        "chardonnay", "sauvignon_blanc", "riesling",
-        "viognier", "pinot_grigio"
-    ]
-    for varietal in whites:
+            lines.append(f"  {_DISPLAY_NAME[varietal]}: {v['texture']}, {v['structure']}")
+    
+    lines.append("\nWHITE VARIETALS:")
+    for varietal in WHITE_VARIETALS:
         if varietal in varietals:
             v = varietals[varietal]
-            print(f"  {varietal.replace('_', ' ').title()}: {v['texture']}, {v['structure']}")
+            lines.append(f"  {_DISPLAY_NAME[varietal]}: {v['texture']}, {v['structure']}")
+    
+    log.info("\n".join(lines))
 
 
 def example_9_balance_exploration():
     """Show how balance parameters affect visuals"""
-    print_section("Example 9: Balance Parameters - Visual Impact")
+    from core import generate_wine_visual_vocabulary
+    lines = [section_header("Example 9: Balance Parameters - Visual Impact")]
     
     # High acid, high tannin - angular and tense
     high_tension = generate_wine_visual_vocabulary(
@@ -305,6 +349,9 @@ def example_9_balance_exploration():
         tannin=9.0,
         body=7.0
     )
+    high_br = high_tension['balance_relationships']
+    high_ts = high_tension['texture_surface']
+    high_cs = high_tension['compositional_structure']
     
     # Low acid, low tannin - soft and relaxed
     low_tension = generate_wine_visual_vocabulary(
@@ -313,22 +360,28 @@ def example_9_balance_exploration():
         tannin=4.0,
         body=7.0
     )
-    
-    print("HIGH TENSION (High Acid + High Tannin - Nebbiolo):")
-    print(f"  Visual tension: {high_tension['balance_relationships']['visual_tension']}")
-    print(f"  Texture: {high_tension['texture_surface']['structure']}")
-    print(f"  Edge quality: {high_tension['compositional_structure']['edge_quality']}")
-    print()
-    
-    print("LOW TENSION (Low Acid + Low Tannin - Grenache):")
-    print(f"  Visual tension: {low_tension['balance_relationships']['visual_tension']}")
-    print(f"  Texture: {low_tension['texture_surface']['structure']}")
-    print(f"  Edge quality: {low_tension['compositional_structure']['edge_quality']}")
+    low_br = low_tension['balance_relationships']
+    low_ts = low_tension['texture_surface']
+    low_cs = low_tension['compositional_structure']
+    
+    lines.append("HIGH TENSION (High Acid + High Tannin - Nebbiolo):")
+    lines.append(f"  Visual tension: {high_br['visual_tension']}")
+    lines.append(f"  Texture: {high_ts['structure']}")
+    lines.append(f"  Edge quality: {high_cs['edge_quality']}")
+    lines.append("")
+    
+    lines.append("LOW TENSION (Low Acid + Low Tannin - Grenache):")
+    lines.append(f"  Visual tension: {low_br['visual_tension']}")
+    lines.append(f"  Texture: {low_ts['structure']}")
+    lines.append(f"  Edge quality: {low_cs['edge_quality']}")
+    
+    log.info("\n".join(lines))
 
 
 def example_10_finish_dimension():
     """Demonstrate finish length impact on visuals"""
-    print_section("Example 10: Finish Length - Atmospheric Depth")
+    from core import generate_wine_visual_vocabulary
+    lines = [section_header("Example 10: Finish Length - Atmospheric Depth")]
     
     finish_lengths = ["short", "medium", "long", "very_long"]
     
@@ -337,20 +390,31 @@ def example_10_finish_dimension():
             varietal="cabernet_sauvignon",
             finish_length=finish
         )
+        fd = result['finish_dimension']
+        aq = result['atmospheric_qualities']
         
-        print(f"{finish.upper()} FINISH:")
-        print(f"  Descriptor: {result['finish_dimension']['descriptor']}")
-        print(f"  Atmospheric depth: {result['atmospheric_qualities']['finish_depth']}")
-        print(f"  Fade pattern: {result['atmospheric_qualities']['fade_pattern']}")
-        print()
+        lines.append(f"{finish.upper()} FINISH:")
+        lines.append(f"  Descriptor: {fd['descriptor']}")
+        lines.append(f"  Atmospheric depth: {aq['finish_depth']}")
+        lines.append(f"  Fade pattern: {aq['fade_pattern']}")
+        lines.append("")
+    
+    log.info("\n".join(lines))
 
 
 if __name__ == "__main__":
-    print("\n")
-    print("*" * 80)
-    print("  WINE TASTING VISUAL VOCABULARY MCP SERVER")
-    print("  Example Usage Demonstrations")
-    print("*" * 80)
+    # Buffer records and write them to stdout in one flush at the end of the run
+    handler = logging.handlers.MemoryHandler(
+        1024, target=logging.StreamHandler(sys.stdout)
+    )
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    
+    log.info("\n\n" + "*" * 80 + "\n"
+             "  WINE TASTING VISUAL VOCABULARY MCP SERVER\n"
+             "  Example Usage Demonstrations\n"
+             + "*" * 80)
     
     # Run all examples
     example_1_basic_burgundy_pinot()
@@ -364,6 +428,5 @@ if __name__ == "__main__":
     example_9_balance_exploration()
     example_10_finish_dimension()
     
-    print("\n" + "="*80)
-    print("  Examples complete!")
-    print("="*80 + "\n")
+    log.info("\n" + "="*80 + "\n  Examples complete!\n" + "="*80 + "\n")
+    handler.flush()
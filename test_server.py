@@ -4,9 +4,14 @@ Test suite for Wine Tasting Visual Vocabulary MCP Server
 Tests categorical properties, morphism preservation, and coherence constraints.
 """
 
+import json
+import re
 import pytest
+import numpy as np
+from statistics import mean
 import asyncio
 import server
+import core
 from server import (
     Varietal,
     ClimateType,
@@ -16,33 +21,91 @@ from server import (
     BalanceProfile,
     VARIETAL_CHARACTERISTICS,
     CLIMATE_MODIFIERS,
+    AGE_TRANSFORMATIONS,
     AROMA_CLUSTERS
 )
 
-# Helper to call wrapped MCP functions synchronously for testing
-def call_tool(tool_name, *args, **kwargs):
-    """Helper to call FastMCP-wrapped tools synchronously in tests"""
-    tool = getattr(server, tool_name)
-    return tool.fn(*args, **kwargs)
-
-# Create convenience wrappers for tests
-def generate_wine_visual_vocabulary(*args, **kwargs):
-    return call_tool('generate_wine_visual_vocabulary', *args, **kwargs)
+# Underlying functions of the FastMCP-wrapped tools, resolved once for testing
+generate_wine_visual_vocabulary = server.generate_wine_visual_vocabulary.fn
+compare_wine_profiles = server.compare_wine_profiles.fn
+get_varietal_list = server.get_varietal_list.fn
+get_aroma_clusters = server.get_aroma_clusters.fn
+create_regional_preset = server.create_regional_preset.fn
+evolution_sequence = server.evolution_sequence.fn
+compute_wine_tasting_trajectory = server.compute_wine_tasting_trajectory.fn
+generate_wine_tasting_rhythmic_sequence = server.generate_wine_tasting_rhythmic_sequence.fn
+
+
+# Vocabulary expectations, matched case-insensitively against generated text
+_DELICATE_RE = re.compile(r"delicate|silky", re.IGNORECASE)
+_LIGHT_WEIGHT_RE = re.compile(r"light|ethereal", re.IGNORECASE)
+_TRANSPARENT_WEIGHT_RE = re.compile(r"light|ethereal|transparent", re.IGNORECASE)
+_STRUCTURED_RE = re.compile(r"structured|firm", re.IGNORECASE)
+_COOL_TEXTURE_RE = re.compile(r"angular|tense|crisp", re.IGNORECASE)
+_ANGULAR_RE = re.compile(r"angular|crisp", re.IGNORECASE)
+_YOUNG_RED_RE = re.compile(r"purple|ruby", re.IGNORECASE)
+_AGED_RED_RE = re.compile(r"brick|tawny", re.IGNORECASE)
+_MATURE_RED_RE = re.compile(r"brick|garnet|tawny", re.IGNORECASE)
+_SEPARATE_RE = re.compile(r"separate|distinct", re.IGNORECASE)
+_INTEGRATED_RE = re.compile(r"seamless|unified", re.IGNORECASE)
+_RESOLVED_RE = re.compile(r"seamless|unified|complete", re.IGNORECASE)
+_BRILLIANT_RE = re.compile(r"brilliant|star-bright", re.IGNORECASE)
+_FADED_RE = re.compile(r"dull|fading", re.IGNORECASE)
+_HIGH_TENSION_RE = re.compile(r"high|angular|taut", re.IGNORECASE)
+_LOW_TENSION_RE = re.compile(r"low|soft|relaxed", re.IGNORECASE)
+_FULL_WEIGHT_RE = re.compile(r"full|dense|heavy", re.IGNORECASE)
+_BOLD_STYLE_RE = re.compile(r"fruit-forward|bold", re.IGNORECASE)
+_UNOAKED_RE = re.compile(r"pure|clean|unadulterated", re.IGNORECASE)
+_FRENCH_OAK_RE = re.compile(r"silky|refined", re.IGNORECASE)
+_SHORT_FINISH_RE = re.compile(r"shallow|immediate", re.IGNORECASE)
+_LONG_FINISH_RE = re.compile(r"deep|vast|infinite", re.IGNORECASE)
+
+
+# Enum members and required attributes, materialized once
+_ALL_VARIETALS = tuple(Varietal)
+_AGES_BY_MATURITY = (
+    AgeCategory.YOUTHFUL,
+    AgeCategory.DEVELOPING,
+    AgeCategory.MATURE,
+    AgeCategory.PAST_PRIME
+)
+_REQUIRED_VARIETAL_KEYS = frozenset([
+    "color_base", "color_hue", "opacity", "texture",
+    "structure", "visual_weight", "characteristic_notes",
+    "edge_quality", "composition"
+])
 
-def compare_wine_profiles(*args, **kwargs):
-    return call_tool('compare_wine_profiles', *args, **kwargs)
+# Varietal opacities in enum order, read by position
+_VARIETAL_INDEX = {v: i for i, v in enumerate(_ALL_VARIETALS)}
+_OPACITY_BY_INDEX = tuple(VARIETAL_CHARACTERISTICS[v]["opacity"] for v in _ALL_VARIETALS)
 
-def get_varietal_list(*args, **kwargs):
-    return call_tool('get_varietal_list', *args, **kwargs)
 
-def get_aroma_clusters(*args, **kwargs):
-    return call_tool('get_aroma_clusters', *args, **kwargs)
+# Saturation adjustments from coolest to hottest climate
+_CLIMATE_SATURATIONS = np.array([
+    CLIMATE_MODIFIERS[climate]["saturation_adjust"]
+    for climate in (ClimateType.COOL, ClimateType.MODERATE, ClimateType.WARM, ClimateType.HOT)
+])
 
-def create_regional_preset(*args, **kwargs):
-    return call_tool('create_regional_preset', *args, **kwargs)
 
-def evolution_sequence(*args, **kwargs):
-    return call_tool('evolution_sequence', *args, **kwargs)
+@pytest.fixture(scope="module")
+def opacity_stats():
+    """Mean opacity of representative red and white varietals"""
+    red_varietals = [
+        Varietal.CABERNET_SAUVIGNON,
+        Varietal.SYRAH,
+        Varietal.MERLOT
+    ]
+    
+    white_varietals = [
+        Varietal.SAUVIGNON_BLANC,
+        Varietal.RIESLING,
+        Varietal.PINOT_GRIGIO
+    ]
+    
+    return (
+        mean(_OPACITY_BY_INDEX[_VARIETAL_INDEX[v]] for v in red_varietals),
+        mean(_OPACITY_BY_INDEX[_VARIETAL_INDEX[v]] for v in white_varietals)
+    )
 
 
 class TestVarietalFunctor:
@@ -50,61 +113,40 @@ class TestVarietalFunctor:
     
     def test_all_varietals_have_complete_characteristics(self):
         """Every varietal must have all required attributes"""
-        required_keys = [
-            "color_base", "color_hue", "opacity", "texture",
-            "structure", "visual_weight", "characteristic_notes",
-            "edge_quality", "composition"
-        ]
-        
-        for varietal in Varietal:
+        for varietal in _ALL_VARIETALS:
             char = VARIETAL_CHARACTERISTICS.get(varietal)
             assert char is not None, f"Missing characteristics for {varietal.value}"
-            
-            for key in required_keys:
-                assert key in char, f"Missing {key} for {varietal.value}"
+            assert _REQUIRED_VARIETAL_KEYS.issubset(char), \
+                f"Missing {sorted(_REQUIRED_VARIETAL_KEYS - char.keys())} for {varietal.value}"
     
-    def test_red_vs_white_opacity_patterns(self):
+    def test_red_vs_white_opacity_patterns(self, opacity_stats):
         """Red wines generally more opaque than whites"""
-        red_varietals = [
-            Varietal.CABERNET_SAUVIGNON,
-            Varietal.SYRAH,
-            Varietal.MERLOT
-        ]
-        
-        white_varietals = [
-            Varietal.SAUVIGNON_BLANC,
-            Varietal.RIESLING,
-            Varietal.PINOT_GRIGIO
-        ]
-        
-        avg_red_opacity = sum(
-            VARIETAL_CHARACTERISTICS[v]["opacity"] for v in red_varietals
-        ) / len(red_varietals)
-        
-        avg_white_opacity = sum(
-            VARIETAL_CHARACTERISTICS[v]["opacity"] for v in white_varietals
-        ) / len(white_varietals)
+        avg_red_opacity, avg_white_opacity = opacity_stats
         
         # Reds can be equally or more opaque, but never significantly less
         assert avg_red_opacity >= avg_white_opacity * 0.9
     
+    def test_is_red_varietal_accepts_names_and_members(self):
+        """Red classification should agree for raw names and enum members"""
+        for varietal in _ALL_VARIETALS:
+            assert server.is_red_varietal(varietal) == server.is_red_varietal(varietal.value.upper())
+        assert server.is_red_varietal(Varietal.NEBBIOLO)
+        assert not server.is_red_varietal("riesling")
+    
     def test_pinot_noir_delicacy(self):
         """Pinot Noir should have characteristically light structure"""
         pinot_char = VARIETAL_CHARACTERISTICS[Varietal.PINOT_NOIR]
         
         assert pinot_char["opacity"] < 0.7, "Pinot should be translucent"
-        assert "delicate" in pinot_char["texture"].lower() or \
-               "silky" in pinot_char["texture"].lower()
-        assert "light" in pinot_char["visual_weight"].lower() or \
-               "ethereal" in pinot_char["visual_weight"].lower()
+        assert _DELICATE_RE.search(pinot_char["texture"])
+        assert _LIGHT_WEIGHT_RE.search(pinot_char["visual_weight"])
     
     def test_cabernet_boldness(self):
         """Cabernet Sauvignon should have bold, structured characteristics"""
         cab_char = VARIETAL_CHARACTERISTICS[Varietal.CABERNET_SAUVIGNON]
         
         assert cab_char["opacity"] > 0.85, "Cabernet should be opaque"
-        assert "structured" in cab_char["texture"].lower() or \
-               "firm" in cab_char["texture"].lower()
+        assert _STRUCTURED_RE.search(cab_char["texture"])
         assert "full" in cab_char["visual_weight"].lower()
 
 
@@ -113,21 +155,8 @@ class TestClimateFunctor:
     
     def test_climate_saturation_progression(self):
         """Warmer climates should increase saturation"""
-        climates_ordered = [
-            ClimateType.COOL,
-            ClimateType.MODERATE,
-            ClimateType.WARM,
-            ClimateType.HOT
-        ]
-        
-        saturations = [
-            CLIMATE_MODIFIERS[climate]["saturation_adjust"]
-            for climate in climates_ordered
-        ]
-        
         # Should be monotonically increasing
-        for i in range(len(saturations) - 1):
-            assert saturations[i] <= saturations[i + 1]
+        assert np.all(np.diff(_CLIMATE_SATURATIONS) >= 0)
     
     def test_cool_climate_characteristics(self):
         """Cool climate should create angular, tense characteristics"""
@@ -135,9 +164,7 @@ class TestClimateFunctor:
         
         assert cool_mod["saturation_adjust"] < 0
         assert cool_mod["brightness_adjust"] >= 0
-        assert "angular" in cool_mod["texture_modifier"].lower() or \
-               "tense" in cool_mod["texture_modifier"].lower() or \
-               "crisp" in cool_mod["texture_modifier"].lower()
+        assert _COOL_TEXTURE_RE.search(cool_mod["texture_modifier"])
     
     def test_warm_climate_characteristics(self):
         """Warm climate should create soft, relaxed characteristics"""
@@ -159,103 +186,53 @@ class TestAgeFunctor:
         past_prime = "brown tawny"
         
         # Simplified check that color descriptors evolve appropriately
-        from server import AGE_TRANSFORMATIONS
+        assert _YOUNG_RED_RE.search(AGE_TRANSFORMATIONS[AgeCategory.YOUTHFUL]["red_color_shift"])
         
-        assert "purple" in AGE_TRANSFORMATIONS[AgeCategory.YOUTHFUL]["red_color_shift"].lower() or \
-               "ruby" in AGE_TRANSFORMATIONS[AgeCategory.YOUTHFUL]["red_color_shift"].lower()
-        
-        assert "brick" in AGE_TRANSFORMATIONS[AgeCategory.MATURE]["red_color_shift"].lower() or \
-               "tawny" in AGE_TRANSFORMATIONS[AgeCategory.MATURE]["red_color_shift"].lower()
+        assert _AGED_RED_RE.search(AGE_TRANSFORMATIONS[AgeCategory.MATURE]["red_color_shift"])
     
     def test_age_integration_progression(self):
         """Wine should become more integrated with age"""
-        from server import AGE_TRANSFORMATIONS
-        
         youthful_integration = AGE_TRANSFORMATIONS[AgeCategory.YOUTHFUL]["integration"]
         mature_integration = AGE_TRANSFORMATIONS[AgeCategory.MATURE]["integration"]
         
-        assert "separate" in youthful_integration.lower() or \
-               "distinct" in youthful_integration.lower()
+        assert _SEPARATE_RE.search(youthful_integration)
         
-        assert "seamless" in mature_integration.lower() or \
-               "unified" in mature_integration.lower() or \
-               "complete" in mature_integration.lower()
+        assert _RESOLVED_RE.search(mature_integration)
     
     def test_clarity_degradation(self):
         """Clarity should degrade: brilliant → bright → clear → dull"""
-        from server import AGE_TRANSFORMATIONS
-        
         clarity_sequence = [
             AGE_TRANSFORMATIONS[age]["visual_clarity"]
-            for age in [AgeCategory.YOUTHFUL, AgeCategory.DEVELOPING, 
-                       AgeCategory.MATURE, AgeCategory.PAST_PRIME]
+            for age in _AGES_BY_MATURITY
         ]
         
-        assert "brilliant" in clarity_sequence[0].lower() or \
-               "star-bright" in clarity_sequence[0].lower()
+        assert _BRILLIANT_RE.search(clarity_sequence[0])
         
-        assert "dull" in clarity_sequence[-1].lower() or \
-               "fading" in clarity_sequence[-1].lower()
+        assert _FADED_RE.search(clarity_sequence[-1])
 
 
 class TestBalanceMorphism:
     """Test that balance relationships create coherent visual parameters"""
     
-    def test_high_acidity_creates_tension(self):
-        """High acidity should create angular, taut visual qualities"""
-        high_acid = BalanceProfile(
-            acidity=9.0,
-            tannin=5.0,
-            sweetness=2.0,
-            alcohol=5.0,
-            body=5.0
-        )
-        
-        tension = high_acid.get_visual_tension()
-        assert "high" in tension.lower() or "angular" in tension.lower() or \
-               "taut" in tension.lower()
-    
-    def test_low_acidity_creates_softness(self):
-        """Low acidity should create soft, relaxed visual qualities"""
-        low_acid = BalanceProfile(
-            acidity=3.0,
-            tannin=3.0,
-            sweetness=2.0,
-            alcohol=5.0,
-            body=5.0
-        )
-        
-        tension = low_acid.get_visual_tension()
-        assert "low" in tension.lower() or "soft" in tension.lower() or \
-               "relaxed" in tension.lower()
-    
-    def test_high_body_creates_density(self):
-        """High body and alcohol should create visual weight"""
-        full_bodied = BalanceProfile(
-            acidity=5.0,
-            tannin=5.0,
-            sweetness=2.0,
-            alcohol=9.0,
-            body=9.0
-        )
-        
-        weight = full_bodied.get_visual_weight()
-        assert "full" in weight.lower() or "dense" in weight.lower() or \
-               "heavy" in weight.lower()
-    
-    def test_light_body_creates_transparency(self):
-        """Low body and alcohol should create light visual weight"""
-        light_bodied = BalanceProfile(
-            acidity=5.0,
-            tannin=5.0,
-            sweetness=2.0,
-            alcohol=3.0,
-            body=3.0
-        )
-        
-        weight = light_bodied.get_visual_weight()
-        assert "light" in weight.lower() or "ethereal" in weight.lower() or \
-               "transparent" in weight.lower()
+    @pytest.mark.parametrize("profile,getter,pattern", [
+        # High acidity should create angular, taut visual qualities
+        (dict(acidity=9.0, tannin=5.0, sweetness=2.0, alcohol=5.0, body=5.0),
+         "get_visual_tension", _HIGH_TENSION_RE),
+        # Low acidity should create soft, relaxed visual qualities
+        (dict(acidity=3.0, tannin=3.0, sweetness=2.0, alcohol=5.0, body=5.0),
+         "get_visual_tension", _LOW_TENSION_RE),
+        # High body and alcohol should create visual weight
+        (dict(acidity=5.0, tannin=5.0, sweetness=2.0, alcohol=9.0, body=9.0),
+         "get_visual_weight", _FULL_WEIGHT_RE),
+        # Low body and alcohol should create light visual weight
+        (dict(acidity=5.0, tannin=5.0, sweetness=2.0, alcohol=3.0, body=3.0),
+         "get_visual_weight", _TRANSPARENT_WEIGHT_RE),
+    ], ids=["high_acidity", "low_acidity", "full_body", "light_body"])
+    def test_balance_visual_quality(self, profile, getter, pattern):
+        """Balance extremes should map to their characteristic visual qualities"""
+        balance = BalanceProfile(**profile)
+        
+        assert pattern.search(getattr(balance, getter)())
 
 
 class TestComposition:
@@ -277,9 +254,9 @@ class TestComposition:
         assert "compositional_structure" in result
         assert "balance_relationships" in result
     
-    def test_burgundy_pinot_composition(self):
+    def test_burgundy_pinot_composition(self, wine_vocab_factory):
         """Classic Burgundy Pinot should have expected characteristics"""
-        result = generate_wine_visual_vocabulary(
+        result = wine_vocab_factory(
             varietal="pinot_noir",
             climate="cool",
             winemaking_style="old_world",
@@ -295,15 +272,15 @@ class TestComposition:
         
         # Should have delicate texture
         texture = result["texture_surface"]["base_texture"]
-        assert "delicate" in texture.lower() or "silky" in texture.lower()
+        assert _DELICATE_RE.search(texture)
         
         # Cool climate should add angular quality
         climate_mod = result["texture_surface"]["climate_modifier"]
-        assert "angular" in climate_mod.lower() or "crisp" in climate_mod.lower()
+        assert _ANGULAR_RE.search(climate_mod)
     
-    def test_napa_cabernet_composition(self):
+    def test_napa_cabernet_composition(self, wine_vocab_factory):
         """Bold Napa Cabernet should have power and density"""
-        result = generate_wine_visual_vocabulary(
+        result = wine_vocab_factory(
             varietal="cabernet_sauvignon",
             climate="warm",
             winemaking_style="new_world",
@@ -323,7 +300,7 @@ class TestComposition:
         
         # New World should be fruit-forward
         aesthetic = result["compositional_structure"]["style_aesthetic"]
-        assert "fruit-forward" in aesthetic.lower() or "bold" in aesthetic.lower()
+        assert _BOLD_STYLE_RE.search(aesthetic)
     
     def test_invalid_varietal_handling(self):
         """Invalid varietal should return error"""
@@ -333,37 +310,48 @@ class TestComposition:
         )
         
         assert "error" in result
+    
+    def test_vocabulary_record_matches_tool_output(self):
+        """The slotted record should flatten to exactly the tool's dict output"""
+        record = core._build_visual_vocabulary(varietal="syrah", climate="warm")
+        result = generate_wine_visual_vocabulary(varietal="syrah", climate="warm")
+        
+        assert not hasattr(record, "__dict__")
+        assert record.to_dict() == result
+        assert list(record.to_dict()) == list(result)
+    
+    def test_repeated_calls_return_independent_results(self):
+        """Memoized inputs must not leak mutations between calls"""
+        params = dict(varietal="merlot", acidity=7.0, primary_aromas=["plum", "cherry"])
+        first = generate_wine_visual_vocabulary(**params)
+        first["color_palette"]["aroma_palette"].append("#000000")
+        first["balance_relationships"]["acidity"] = 0
+        
+        second = generate_wine_visual_vocabulary(**params)
+        assert "#000000" not in second["color_palette"]["aroma_palette"]
+        assert second["balance_relationships"]["acidity"] == 7.0
 
 
 class TestRegionalPresets:
     """Test that regional presets produce expected characteristics"""
     
-    def test_burgundy_red_preset(self):
-        """Burgundy red should be Pinot Noir with cool climate"""
-        result = create_regional_preset("burgundy_red")
-        
-        assert "error" not in result
-        assert result["metadata"]["varietal"] == "pinot_noir"
-        assert result["metadata"]["climate"] == "cool"
-        assert result["metadata"]["winemaking_style"] == "old_world"
-    
-    def test_napa_cabernet_preset(self):
-        """Napa Cabernet should be warm climate New World"""
-        result = create_regional_preset("napa_cabernet")
+    @pytest.mark.parametrize("region,expected", [
+        ("burgundy_red", {"varietal": "pinot_noir", "climate": "cool", "winemaking_style": "old_world"}),
+        ("napa_cabernet", {"varietal": "cabernet_sauvignon", "climate": "warm", "winemaking_style": "new_world"}),
+        ("mosel_riesling", {"varietal": "riesling", "climate": "cool", "oak_treatment": "none"}),
+    ])
+    def test_preset(self, region, expected, preset_cache):
+        """Presets should carry their region's typical varietal, climate and style"""
+        result = preset_cache[region]
         
         assert "error" not in result
-        assert result["metadata"]["varietal"] == "cabernet_sauvignon"
-        assert result["metadata"]["climate"] == "warm"
-        assert result["metadata"]["winemaking_style"] == "new_world"
+        for key, value in expected.items():
+            assert result["metadata"][key] == value
     
-    def test_mosel_riesling_preset(self):
-        """Mosel Riesling should be cool, no oak, high acidity"""
-        result = create_regional_preset("mosel_riesling")
+    def test_mosel_riesling_acidity(self, preset_cache):
+        """Mosel Riesling should have high acidity"""
+        result = preset_cache["mosel_riesling"]
         
-        assert "error" not in result
-        assert result["metadata"]["varietal"] == "riesling"
-        assert result["metadata"]["climate"] == "cool"
-        assert result["metadata"]["oak_treatment"] == "none"
         assert result["balance_relationships"]["acidity"] >= 8.0
     
     def test_invalid_region_handling(self):
@@ -377,12 +365,9 @@ class TestRegionalPresets:
 class TestEvolutionSequence:
     """Test temporal transformation sequences"""
     
-    def test_evolution_sequence_structure(self):
+    def test_evolution_sequence_structure(self, pinot_cool_evolution):
         """Evolution sequence should have all age categories"""
-        result = evolution_sequence(
-            varietal="pinot_noir",
-            climate="cool"
-        )
+        result = pinot_cool_evolution
         
         assert "evolution_sequence" in result
         assert "youthful" in result["evolution_sequence"]
@@ -390,89 +375,76 @@ class TestEvolutionSequence:
         assert "mature" in result["evolution_sequence"]
         assert "past_prime" in result["evolution_sequence"]
     
-    def test_color_evolution_in_sequence(self):
+    def test_color_evolution_in_sequence(self, pinot_cool_evolution):
         """Color should evolve systematically through sequence"""
-        result = evolution_sequence(
-            varietal="pinot_noir",
-            climate="cool"
-        )
+        result = pinot_cool_evolution
         
         youthful_color = result["evolution_sequence"]["youthful"]["base_color"]["age_modified"]
         mature_color = result["evolution_sequence"]["mature"]["base_color"]["age_modified"]
         
         # Youthful should have purple/ruby
-        assert "purple" in youthful_color.lower() or "ruby" in youthful_color.lower()
+        assert _YOUNG_RED_RE.search(youthful_color)
         
         # Mature should have brick/garnet/tawny
-        assert "brick" in mature_color.lower() or \
-               "garnet" in mature_color.lower() or \
-               "tawny" in mature_color.lower()
+        assert _MATURE_RED_RE.search(mature_color)
     
-    def test_texture_integration_in_sequence(self):
+    def test_texture_integration_in_sequence(self, cab_moderate_evolution):
         """Texture should integrate over time"""
-        result = evolution_sequence(
-            varietal="cabernet_sauvignon",
-            climate="moderate",
-            tannin=8.0
-        )
+        result = cab_moderate_evolution
         
         youthful_integration = result["evolution_sequence"]["youthful"]["compositional_structure"]["integration"]
         mature_integration = result["evolution_sequence"]["mature"]["compositional_structure"]["integration"]
         
         # Youthful should be separate/distinct
-        assert "separate" in youthful_integration.lower() or \
-               "distinct" in youthful_integration.lower()
+        assert _SEPARATE_RE.search(youthful_integration)
         
         # Mature should be seamless/unified
-        assert "seamless" in mature_integration.lower() or \
-               "unified" in mature_integration.lower()
+        assert _INTEGRATED_RE.search(mature_integration)
 
 
 class TestComparison:
     """Test wine profile comparisons"""
     
-    def test_compare_pinot_vs_cabernet(self):
-        """Comparing Pinot vs Cabernet should show clear contrasts"""
-        result = compare_wine_profiles(
-            wine1_params={
-                "varietal": "pinot_noir",
-                "climate": "cool",
-                "body": 5.0
-            },
-            wine2_params={
-                "varietal": "cabernet_sauvignon",
-                "climate": "warm",
-                "body": 9.0
-            }
-        )
-        
-        assert "color_contrast" in result
-        assert "texture_contrast" in result
-        assert "weight_contrast" in result
-    
-    def test_compare_age_difference(self):
-        """Same wine at different ages should show evolution"""
-        result = compare_wine_profiles(
-            wine1_params={
-                "varietal": "pinot_noir",
-                "age": "youthful"
-            },
-            wine2_params={
-                "varietal": "pinot_noir",
-                "age": "mature"
-            }
-        )
-        
-        assert "atmospheric_contrast" in result
+    @pytest.mark.parametrize("wine1_params,wine2_params,required_keys", [
+        # Comparing Pinot vs Cabernet should show clear contrasts
+        ({"varietal": "pinot_noir", "climate": "cool", "body": 5.0},
+         {"varietal": "cabernet_sauvignon", "climate": "warm", "body": 9.0},
+         {"color_contrast", "texture_contrast", "weight_contrast"}),
+        # Same wine at different ages should show evolution
+        ({"varietal": "pinot_noir", "age": "youthful"},
+         {"varietal": "pinot_noir", "age": "mature"},
+         {"atmospheric_contrast"}),
+    ], ids=["pinot_vs_cabernet", "age_difference"])
+    def test_comparison_contrasts(self, compare_cached, wine1_params, wine2_params, required_keys):
+        """Contrasting wines should report the contrasts that set them apart"""
+        result = compare_cached(wine1_params, wine2_params)
+        
+        assert required_keys.issubset(result), \
+            f"Missing {sorted(required_keys - result.keys())}"
+
+
+@pytest.fixture(scope="module")
+def palette_masks(clusters):
+    """Each aroma cluster's color palette as a bitmask over all palette colors"""
+    all_colors = sorted({
+        color for cluster in clusters.values() for color in cluster["color_palette"]
+    })
+    color_bits = {color: 1 << i for i, color in enumerate(all_colors)}
+    
+    masks = {}
+    for cluster_name, cluster_data in clusters.items():
+        mask = 0
+        for color in cluster_data["color_palette"]:
+            mask |= color_bits[color]
+        masks[cluster_name] = mask
+    return masks
 
 
 class TestAromaClusters:
     """Test aroma cluster mappings"""
     
-    def test_aroma_clusters_complete(self):
+    def test_aroma_clusters_complete(self, clusters):
         """All aroma clusters should have required fields"""
-        clusters = get_aroma_clusters()
-        
         for cluster_name, cluster_data in clusters.items():
             assert "notes" in cluster_data
             assert "color_palette" in cluster_data
@@ -482,54 +454,66 @@ class TestAromaClusters:
             # Should have multiple colors
             assert len(cluster_data["color_palette"]) >= 2
     
-    def test_red_vs_black_fruit_distinction(self):
+    def test_red_vs_black_fruit_distinction(self, palette_masks):
         """Red and black fruit should have different palettes"""
-        clusters = get_aroma_clusters()
-        
-        red_fruit_colors = set(clusters["red_fruit"]["color_palette"])
-        black_fruit_colors = set(clusters["black_fruit"]["color_palette"])
+        red_fruit_mask = palette_masks["red_fruit"]
+        black_fruit_mask = palette_masks["black_fruit"]
         
         # Should be mostly distinct
-        overlap = red_fruit_colors.intersection(black_fruit_colors)
-        assert len(overlap) < len(red_fruit_colors) * 0.5
+        overlap = red_fruit_mask & black_fruit_mask
+        assert overlap.bit_count() < red_fruit_mask.bit_count() * 0.5
+    
+    def test_note_index_covers_every_cluster_note(self):
+        """Every cluster note should map back to the clusters listing it"""
+        for cluster_name, cluster_data in AROMA_CLUSTERS.items():
+            for note in cluster_data["notes"]:
+                assert cluster_name in server.NOTE_TO_CLUSTERS[note]
+        
+        assert server.NOTE_TO_CLUSTERS["plum"] == ("black_fruit", "stone_fruit")
 
 
 class TestVarietalList:
     """Test varietal listing functionality"""
     
-    def test_get_varietal_list_structure(self):
+    def test_get_varietal_list_structure(self, varietals):
         """Varietal list should include all supported varieties"""
-        varietals = get_varietal_list()
-        
         # Should have both reds and whites
         assert "pinot_noir" in varietals
         assert "cabernet_sauvignon" in varietals
         assert "chardonnay" in varietals
         assert "riesling" in varietals
     
-    def test_varietal_list_completeness(self):
+    def test_varietal_list_completeness(self, varietals):
         """Each varietal should have expected information"""
-        varietals = get_varietal_list()
-        
         for varietal_name, varietal_info in varietals.items():
             assert "color" in varietal_info
             assert "texture" in varietal_info
             assert "structure" in varietal_info
             assert "notes" in varietal_info
             assert len(varietal_info["notes"]) > 0
+    
+    def test_varietal_list_mutation_does_not_leak(self):
+        """Mutating one result must not corrupt later calls"""
+        first = get_varietal_list()
+        first["pinot_noir"] = "x"
+        first["merlot"]["color"] = "x"
+        
+        second = get_varietal_list()
+        assert isinstance(second["pinot_noir"], dict)
+        assert second["merlot"]["color"] != "x"
 
 
 class TestCoherenceConstraints:
     """Test that categorical coherence is maintained"""
     
-    def test_oak_none_vs_french_distinction(self):
+    def test_oak_none_vs_french_distinction(self, wine_vocab_factory):
         """No oak vs French oak should show clear differences"""
-        no_oak = generate_wine_visual_vocabulary(
+        no_oak = wine_vocab_factory(
             varietal="riesling",
             oak_treatment="none"
         )
         
-        french_oak = generate_wine_visual_vocabulary(
+        french_oak = wine_vocab_factory(
             varietal="chardonnay",
             oak_treatment="french_oak"
         )
@@ -537,22 +521,19 @@ class TestCoherenceConstraints:
         no_oak_texture = no_oak["texture_surface"]["oak_overlay"]
         french_oak_texture = french_oak["texture_surface"]["oak_overlay"]
         
-        assert "pure" in no_oak_texture.lower() or \
-               "clean" in no_oak_texture.lower() or \
-               "unadulterated" in no_oak_texture.lower()
+        assert _UNOAKED_RE.search(no_oak_texture)
         
-        assert "silky" in french_oak_texture.lower() or \
-               "refined" in french_oak_texture.lower() or \
+        assert _FRENCH_OAK_RE.search(french_oak_texture) or \
                "vanilla" in french_oak["material_references"]["finish_quality"].lower()
     
-    def test_finish_length_atmospheric_depth(self):
+    def test_finish_length_atmospheric_depth(self, wine_vocab_factory):
         """Finish length should affect atmospheric depth consistently"""
-        short_finish = generate_wine_visual_vocabulary(
+        short_finish = wine_vocab_factory(
             varietal="pinot_noir",
             finish_length="short"
         )
         
-        long_finish = generate_wine_visual_vocabulary(
+        long_finish = wine_vocab_factory(
             varietal="pinot_noir",
             finish_length="very_long"
         )
@@ -560,9 +541,37 @@ class TestCoherenceConstraints:
         short_depth = short_finish["atmospheric_qualities"]["finish_depth"]
         long_depth = long_finish["atmospheric_qualities"]["finish_depth"]
         
-        assert "shallow" in short_depth.lower() or "immediate" in short_depth.lower()
-        assert "deep" in long_depth.lower() or "vast" in long_depth.lower() or \
-               "infinite" in long_depth.lower()
+        assert _SHORT_FINISH_RE.search(short_depth)
+        assert _LONG_FINISH_RE.search(long_depth)
+
+
+
+class TestTrajectory:
+    """Test morphospace trajectory layouts"""
+    
+    def test_columnar_layout_matches_records(self):
+        """Columnar trajectories should carry the same steps as the record form"""
+        records = json.loads(compute_wine_tasting_trajectory(
+            "burgundian_silk", "napa_monument", 5))
+        columns = json.loads(compute_wine_tasting_trajectory(
+            "burgundian_silk", "napa_monument", 5, columnar=True))
+        
+        names = columns["trajectory"]["parameter_names"]
+        assert len(columns["trajectory"]["step"]) == len(records["trajectory"]) == 6
+        for i, record in enumerate(records["trajectory"]):
+            assert columns["trajectory"]["t"][i] == record["t"]
+            assert dict(zip(names, columns["trajectory"]["state"][i])) == record["state"]
+            assert columns["trajectory"]["nearest_visual_type"][i] == record["nearest_visual_type"]
+            assert columns["trajectory"]["distance_to_nearest"][i] == record["distance_to_nearest"]
+    
+    def test_rhythmic_sequence_rejects_fractional_cycles(self):
+        """Step and cycle counts must be integers, even after an integer call is cached"""
+        generate_wine_tasting_rhythmic_sequence("young_burgundy", "napa_cabernet", num_cycles=2)
+        
+        with pytest.raises(TypeError):
+            generate_wine_tasting_rhythmic_sequence("young_burgundy", "napa_cabernet", num_cycles=2.5)
+        with pytest.raises(TypeError):
+            generate_wine_tasting_rhythmic_sequence("young_burgundy", "napa_cabernet", num_cycles=2.0)
 
 
 if __name__ == "__main__":